@@ -5,6 +5,7 @@ Docker TUI - Container Actions Module
 Handles container actions menu and operations.
 """
 import curses
+import curses.panel
 import subprocess
 import time
 from ..utils.utils import safe_addstr
@@ -36,10 +37,19 @@ def show_menu(tui, stdscr, container):
         menu = curses.newwin(menu_height, menu_width, 1, 0)
         menu.keypad(True)  # Enable keypad for arrow keys
         menu.border()
+        # Panel lets us restore only the cells the menu covered on close
+        menu_panel = curses.panel.new_panel(menu)
+        menu_y, menu_x = menu.getbegyx()
         
-        # Draw title
+        # Draw title and help once - they never change while the menu is open
         title = f" Container: {container.name[:20]} "
         safe_addstr(menu, 0, (menu_width - len(title))//2, title)
+        help_text = "↑/↓:Navigate | Enter/Click:Select | ESC:Cancel"
+        safe_addstr(menu, menu_height - 1, (menu_width - len(help_text))//2, help_text, curses.A_DIM)
+        
+        # Option texts and the blank row are loop-invariant
+        texts = [f"{key}: {label}" for key, label, _ in opts]
+        blank = " " * (menu_width - 4)
         
         # Current selection
         current = 0
@@ -47,10 +57,7 @@ def show_menu(tui, stdscr, container):
         # Menu loop
         while True:
             # Draw all options
-            for i, (key, label, enabled) in enumerate(opts):
-                # Format option text
-                text = f"{key}: {label}"
-                
+            for i, (_, _, enabled) in enumerate(opts):
                 # Determine attributes
                 if i == current and enabled:
                     attr = curses.color_pair(7) | curses.A_BOLD
@@ -62,12 +69,8 @@ def show_menu(tui, stdscr, container):
                     attr = curses.A_DIM
                 
                 # Draw option
-                safe_addstr(menu, i + 2, 2, " " * (menu_width - 4), curses.A_NORMAL)
-                safe_addstr(menu, i + 2, 2, text, attr)
-            
-            # Draw help
-            help_text = "↑/↓:Navigate | Enter/Click:Select | ESC:Cancel"
-            safe_addstr(menu, menu_height - 1, (menu_width - len(help_text))//2, help_text, curses.A_DIM)
+                safe_addstr(menu, i + 2, 2, blank, curses.A_NORMAL)
+                safe_addstr(menu, i + 2, 2, texts[i], attr)
             
             menu.refresh()
             
@@ -95,15 +98,15 @@ def show_menu(tui, stdscr, container):
                 try:
                     _, mx, my, _, button_state = curses.getmouse()
                     if button_state & curses.BUTTON1_CLICKED:
-                        # Check if click was on a menu item
-                        for i, (_, _, enabled) in enumerate(opts):
-                            if my == i + 2 and enabled:
-                                action_key = opts[i][0].lower()
-                                break
-                        else:
-                            # Click not on menu item, continue loop
-                            continue
-                        break
+                        # Options sit at a fixed offset inside the menu, so the
+                        # clicked row maps directly to an option index
+                        idx = my - menu_y - 2
+                        col = mx - menu_x
+                        if 0 <= idx < len(opts) and 2 <= col < menu_width - 2 and opts[idx][2]:
+                            action_key = opts[idx][0].lower()
+                            break
+                        # Click not on menu item, continue loop
+                        continue
                 except curses.error:
                     pass
             
@@ -133,22 +136,40 @@ def show_menu(tui, stdscr, container):
                     continue
                 break
         
-        # Clean up
+        # Clean up - hide the panel so only the damaged rectangle is repainted
+        menu_panel.hide()
+        curses.panel.update_panels()
+        curses.doupdate()
+        del menu_panel
         del menu
-        stdscr.touchwin()
-        stdscr.refresh()
         
         # Return selected action
         return action_key
                 
     except Exception as e:
-        # Show error and wait for key
+        # Show error in a small box and wait for key; only the rows it
+        # covered are repainted afterwards instead of clearing the screen
         h, w = stdscr.getmaxyx()
-        stdscr.clear()
-        safe_addstr(stdscr, h//2, (w-len(str(e))-10)//2, f"Error: {e}", curses.A_BOLD)
-        safe_addstr(stdscr, h//2+1, (w-25)//2, "Press any key to continue...", curses.A_DIM)
-        stdscr.refresh()
-        stdscr.getch()
+        msg = f"Error: {e}"
+        prompt = "Press any key to continue..."
+        err_h = 4
+        err_w = max(1, min(w - 4, max(len(msg), len(prompt)) + 4))
+        err_y = max(0, h//2 - 1)
+        err_x = max(0, (w - err_w)//2)
+        try:
+            err_win = curses.newwin(err_h, err_w, err_y, err_x)
+            err_win.border()
+            safe_addstr(err_win, 1, 2, msg[:err_w - 4], curses.A_BOLD)
+            safe_addstr(err_win, 2, 2, prompt[:err_w - 4], curses.A_DIM)
+            err_win.refresh()
+            err_win.getch()
+            err_win.erase()
+            err_win.refresh()
+            del err_win
+            stdscr.touchline(err_y, min(err_h, h - err_y))
+            stdscr.refresh()
+        except curses.error:
+            pass
         return 'c'  # Return cancel on error
 
 def execute_action(tui, stdscr, container, action_key):
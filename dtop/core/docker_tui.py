@@ -55,6 +55,9 @@ class DockerTUI:
         # Log line wrapping toggle (default: on)
         self.wrap_log_lines = True
         
+        # Maximum log lines the log view keeps in memory while following
+        self.log_max_lines = 25000
+        
         # Scrolling position for main container list
         self.scroll_offset = 0
         
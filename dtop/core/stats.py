@@ -22,8 +22,17 @@ except ImportError:
     print("Warning: aiohttp not installed. Stats collection will be limited.", file=sys.stderr)
     print("Install with: pip install aiohttp", file=sys.stderr)
 
+# Stats payloads are parsed once per container per tick, so use orjson when it
+# is installed; both parsers accept the raw response bytes
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 DOCKER_SOCKET_PATH = "/var/run/docker.sock"
 BASE_URL = "http://localhost"  # hostname is ignored when using UnixConnector
+STREAM_READ_TIMEOUT = 10.0  # Docker sends a sample about every second
+STREAM_RECONNECT_DELAY = 1.0  # Pause before reopening a dropped stream
 
 
 def parse_blkio_stats(stats: dict) -> Tuple[int, int]:
@@ -137,6 +146,8 @@ class AsyncStatsCollector:
         self.session: Optional['aiohttp.ClientSession'] = None
         self.previous_stats: Dict[str, dict] = {}
         self.previous_timestamp: Dict[str, float] = {}
+        # One long-lived stats stream per running container
+        self.stream_tasks: Dict[str, asyncio.Task] = {}
         # ADDED: Track last cleanup time
         self.last_cleanup_time = time.time()
         self.cleanup_interval = 300  # Clean up every 5 minutes
@@ -146,11 +157,12 @@ class AsyncStatsCollector:
         if not AIOHTTP_AVAILABLE:
             return self
             
-        # ADDED: Connection limits to prevent resource exhaustion
+        # Each running container holds one streaming connection for as long
+        # as it runs, so the pool cannot be capped below the container count
         connector = aiohttp.UnixConnector(
             path=DOCKER_SOCKET_PATH,
-            limit=150,  # Increased for high container count
-            limit_per_host=100  # Increased for high container count
+            limit=0,
+            limit_per_host=0
         )
         timeout = aiohttp.ClientTimeout(total=5.0)  # 5 second timeout
         self.session = aiohttp.ClientSession(
@@ -160,7 +172,12 @@ class AsyncStatsCollector:
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Close aiohttp session."""
+        """Stop all stats streams and close aiohttp session."""
+        for task in self.stream_tasks.values():
+            task.cancel()
+        if self.stream_tasks:
+            await asyncio.gather(*self.stream_tasks.values(), return_exceptions=True)
+        self.stream_tasks.clear()
         if self.session:
             await self.session.close()
             
@@ -195,120 +212,136 @@ class AsyncStatsCollector:
             
             async with self.session.get(url) as resp:
                 if resp.status == 200:
-                    return await resp.json()
+                    return json_loads(await resp.read())
         except Exception:
             pass
             
         return []
         
-    async def fetch_container_stats(self, container_id: str) -> Optional[dict]:
-        """Fetch stats for a single container."""
-        if not self.session:
-            return None
-            
-        try:
-            url = f"{BASE_URL}/containers/{container_id}/stats?stream=false"
-            
-            async with self.session.get(url) as resp:
-                if resp.status == 200:
-                    return await resp.json()
-        except Exception:
-            pass
+    async def stream_container_stats(self, container_id: str) -> None:
+        """Keep a streaming stats connection open for a container.
+        
+        Docker pushes one sample per second on the stream, so each sample
+        updates the cache without a new request or Docker's one-shot
+        sampling delay. Dropped streams are reopened until the task is
+        cancelled.
+        """
+        url = f"{BASE_URL}/containers/{container_id}/stats?stream=true"
+        timeout = aiohttp.ClientTimeout(total=None, sock_read=STREAM_READ_TIMEOUT)
+        
+        while self.session and not self.session.closed:
+            try:
+                async with self.session.get(url, timeout=timeout) as resp:
+                    if resp.status == 404:
+                        return
+                    if resp.status == 200:
+                        async for line in resp.content:
+                            if not line.strip():
+                                continue
+                            try:
+                                result = json_loads(line)
+                            except ValueError:
+                                continue
+                            self.record_stats(container_id, result, time.time())
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                pass
             
-        return None
+            await asyncio.sleep(STREAM_RECONNECT_DELAY)
         
-    async def collect_all_stats(self, containers: List) -> None:
-        """Collect stats for all containers in parallel."""
-        # ADDED: Periodic cleanup
-        await self.cleanup_old_entries()
+    def record_stats(self, container_id: str, result: dict, current_time: float) -> None:
+        """Parse one stats sample and update the TUI stats cache."""
+        # Parse stats
+        cpu_percent = parse_cpu_stats(result)
+        mem_percent = parse_memory_stats(result)
+        read_bytes, write_bytes = parse_blkio_stats(result)
+        rx_bytes, tx_bytes = parse_network_stats(result)
         
-        # Filter running containers
-        running_containers = [c for c in containers if c.status == 'running']
+        # Calculate rates if we have previous data
+        prev_stats = self.previous_stats.get(container_id, {})
+        prev_time = self.previous_timestamp.get(container_id, current_time)
+        time_delta = current_time - prev_time
         
-        if not running_containers:
-            return
-            
-        # Fetch stats for all containers in parallel
-        tasks = [self.fetch_container_stats(c.id) for c in running_containers]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Initialize rates
+        read_rate = write_rate = rx_rate = tx_rate = 0.0
         
-        current_time = time.time()
+        if time_delta > 0.5 and prev_stats:  # At least 0.5 seconds
+            # Calculate byte rates
+            prev_read = prev_stats.get('read_bytes', read_bytes)
+            prev_write = prev_stats.get('write_bytes', write_bytes)
+            prev_rx = prev_stats.get('rx_bytes', rx_bytes)
+            prev_tx = prev_stats.get('tx_bytes', tx_bytes)
         
-        # Process results
-        for container, result in zip(running_containers, results):
-            if isinstance(result, Exception) or result is None:
-                continue
-                
-            container_id = container.id
-            
-            # Parse stats
-            cpu_percent = parse_cpu_stats(result)
-            mem_percent = parse_memory_stats(result)
-            read_bytes, write_bytes = parse_blkio_stats(result)
-            rx_bytes, tx_bytes = parse_network_stats(result)
-            
-            # Calculate rates if we have previous data
-            prev_stats = self.previous_stats.get(container_id, {})
-            prev_time = self.previous_timestamp.get(container_id, current_time)
-            time_delta = current_time - prev_time
-            
-            # Initialize rates
-            read_rate = write_rate = rx_rate = tx_rate = 0.0
-            
-            if time_delta > 0.5 and prev_stats:  # At least 0.5 seconds
-                # Calculate byte rates
-                prev_read = prev_stats.get('read_bytes', read_bytes)
-                prev_write = prev_stats.get('write_bytes', write_bytes)
-                prev_rx = prev_stats.get('rx_bytes', rx_bytes)
-                prev_tx = prev_stats.get('tx_bytes', tx_bytes)
-                
-                # Only calculate positive rates (handle counter resets)
-                if read_bytes >= prev_read:
-                    read_rate = (read_bytes - prev_read) / time_delta
-                if write_bytes >= prev_write:
-                    write_rate = (write_bytes - prev_write) / time_delta
-                if rx_bytes >= prev_rx:
-                    rx_rate = (rx_bytes - prev_rx) / time_delta
-                if tx_bytes >= prev_tx:
-                    tx_rate = (tx_bytes - prev_tx) / time_delta
-            elif prev_stats:
-                # Keep previous rates if time delta is too small
-                read_rate = prev_stats.get('block_read_rate', 0)
-                write_rate = prev_stats.get('block_write_rate', 0)
-                rx_rate = prev_stats.get('net_in_rate', 0)
-                tx_rate = prev_stats.get('net_out_rate', 0)
-            
-            # Update cache
-            with self.tui.stats_lock:
-                self.tui.stats_cache[container_id] = {
-                    'cpu': cpu_percent,
-                    'mem': mem_percent,
-                    'net_rx': rx_bytes,
-                    'net_tx': tx_bytes,
-                    'net_in_rate': rx_rate,
-                    'net_out_rate': tx_rate,
-                    'block_read': read_bytes,
-                    'block_write': write_bytes,
-                    'block_read_rate': read_rate,
-                    'block_write_rate': write_rate,
-                    'time': current_time
-                }
-            
-            # Store current stats for next iteration
-            self.previous_stats[container_id] = {
-                'read_bytes': read_bytes,
-                'write_bytes': write_bytes,
-                'rx_bytes': rx_bytes,
-                'tx_bytes': tx_bytes,
+            # Only calculate positive rates (handle counter resets)
+            if read_bytes >= prev_read:
+                read_rate = (read_bytes - prev_read) / time_delta
+            if write_bytes >= prev_write:
+                write_rate = (write_bytes - prev_write) / time_delta
+            if rx_bytes >= prev_rx:
+                rx_rate = (rx_bytes - prev_rx) / time_delta
+            if tx_bytes >= prev_tx:
+                tx_rate = (tx_bytes - prev_tx) / time_delta
+        elif prev_stats:
+            # Keep previous rates if time delta is too small
+            read_rate = prev_stats.get('block_read_rate', 0)
+            write_rate = prev_stats.get('block_write_rate', 0)
+            rx_rate = prev_stats.get('net_in_rate', 0)
+            tx_rate = prev_stats.get('net_out_rate', 0)
+        
+        # Update cache
+        with self.tui.stats_lock:
+            self.tui.stats_cache[container_id] = {
+                'cpu': cpu_percent,
+                'mem': mem_percent,
+                'net_rx': rx_bytes,
+                'net_tx': tx_bytes,
+                'net_in_rate': rx_rate,
+                'net_out_rate': tx_rate,
+                'block_read': read_bytes,
+                'block_write': write_bytes,
                 'block_read_rate': read_rate,
                 'block_write_rate': write_rate,
-                'net_in_rate': rx_rate,
-                'net_out_rate': tx_rate
+                'time': current_time
             }
-            self.previous_timestamp[container_id] = current_time
+        
+        # Store current stats for next iteration
+        self.previous_stats[container_id] = {
+            'read_bytes': read_bytes,
+            'write_bytes': write_bytes,
+            'rx_bytes': rx_bytes,
+            'tx_bytes': tx_bytes,
+            'block_read_rate': read_rate,
+            'block_write_rate': write_rate,
+            'net_in_rate': rx_rate,
+            'net_out_rate': tx_rate
+        }
+        self.previous_timestamp[container_id] = current_time
+        
+    async def collect_all_stats(self, containers: List) -> None:
+        """Start stats streams for new running containers and stop stale ones."""
+        # ADDED: Periodic cleanup
+        await self.cleanup_old_entries()
+        
+        if not self.session:
+            return
+        
+        current_ids = {c.id for c in containers if c.status == 'running'}
+        
+        # Streams end on their own when a container goes away; forget those
+        for container_id, task in list(self.stream_tasks.items()):
+            if task.done():
+                del self.stream_tasks[container_id]
+        
+        for container_id in current_ids - self.stream_tasks.keys():
+            self.stream_tasks[container_id] = asyncio.ensure_future(
+                self.stream_container_stats(container_id)
+            )
+        
+        for container_id in self.stream_tasks.keys() - current_ids:
+            self.stream_tasks.pop(container_id).cancel()
             
         # Clean up stats for containers that are no longer running
-        current_ids = {c.id for c in containers if c.status == 'running'}
         stale_ids = set(self.previous_stats.keys()) - current_ids
         
         for stale_id in stale_ids:
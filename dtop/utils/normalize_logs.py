@@ -22,6 +22,10 @@ GLOBAL_PREFERRED_KEYS = [
 ]
 WALRUS_PREFERRED_KEYS = ["target", "filename", "line_number"]
 
+# Batch terminator used by long-running callers: echoed back verbatim and
+# flushed so the caller knows every line of the batch has been written.
+BATCH_SENTINEL = "<<<EOB>>>"
+
 
 def format_timestamp(ts):
     """
@@ -226,6 +230,9 @@ def main():
     for line in sys.stdin:
         # Strip ANSI color codes and newline
         line = strip_ansi(line.rstrip("\n"))
+        if line == BATCH_SENTINEL:
+            _write_out(line)
+            continue
         try:
             obj = json.loads(line)
         except json.JSONDecodeError:
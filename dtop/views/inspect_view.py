@@ -89,14 +89,15 @@ def evaluate_filter(tokens, line, case_sensitive=False):
     if not tokens:
         return True
     
-    flags = 0 if case_sensitive else re.IGNORECASE
+    # Terms are literals, so a substring test on a lowercased line replaces regex
+    if not case_sensitive:
+        line = line.lower()
     
     def evaluate_term(term, line):
         if term.startswith('!') or term.startswith('-'):
             search_term = term[1:]
             if search_term:
-                pattern = re.compile(re.escape(search_term), flags)
-                return not pattern.search(line)
+                return (search_term if case_sensitive else search_term.lower()) not in line
             return True
         elif term.startswith('+'):
             search_term = term[1:]
@@ -104,8 +105,7 @@ def evaluate_filter(tokens, line, case_sensitive=False):
             search_term = term
         
         if search_term:
-            pattern = re.compile(re.escape(search_term), flags)
-            return bool(pattern.search(line))
+            return (search_term if case_sensitive else search_term.lower()) in line
         return True
     
     def parse_expression(pos=0):
@@ -176,20 +176,37 @@ def flatten_json(obj, parent_key='', sep='.'):
     return items
 
 
+def find_literal_spans(text, needle, case_sensitive=False):
+    """Yield (start, end) spans of the non-overlapping occurrences of needle in text"""
+    if not needle:
+        return
+    if not case_sensitive:
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # Lowercasing changed the length (e.g. "İ"), so offsets in the
+            # lowered copy are not columns of text; search it directly
+            for m in re.finditer(re.escape(needle), text, re.IGNORECASE):
+                yield m.start(), m.end()
+            return
+        text = lowered
+        needle = needle.lower()
+    start = text.find(needle)
+    while start != -1:
+        end = start + len(needle)
+        yield start, end
+        start = text.find(needle, end)
+
+
 def search_json_lines(lines, search_pattern, case_sensitive=False):
     """Search for pattern in JSON lines and return matching line indices"""
     if not search_pattern:
         return []
     
-    flags = 0 if case_sensitive else re.IGNORECASE
-    pattern = re.compile(re.escape(search_pattern), flags)
-    
-    matches = []
-    for i, line in enumerate(lines):
-        if pattern.search(line):
-            matches.append(i)
-    
-    return matches
+    # The pattern is a literal, so a substring test replaces the regex
+    if case_sensitive:
+        return [i for i, line in enumerate(lines) if search_pattern in line]
+    needle = search_pattern.lower()
+    return [i for i, line in enumerate(lines) if needle in line.lower()]
 
 
 def filter_json_lines(lines, json_data, filter_string, case_sensitive=False):
@@ -440,16 +457,11 @@ def show_inspect(tui, stdscr, container):
                             
                             # Highlight search matches
                             if search_string and line_idx in search_matches:
-                                # Find the match position in the line
-                                flags = 0 if case_sensitive else re.IGNORECASE
-                                pattern = re.compile(re.escape(search_string), flags)
-                                
                                 y = content_start + i
                                 x = 0
                                 
                                 # Draw line with highlights
-                                for match in pattern.finditer(lines[line_idx]):
-                                    start, end = match.span()
+                                for start, end in find_literal_spans(lines[line_idx], search_string, case_sensitive):
                                     # Adjust for horizontal scroll
                                     if h_scroll > 0:
                                         start -= h_scroll
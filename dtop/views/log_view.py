@@ -4,20 +4,36 @@ Docker TUI - Log View Module
 -----------
 Handles container log viewing with advanced filtering and dynamic tail support.
 """
+import array
+import bisect
+import calendar
 import curses
 import re
+import select
+import threading
 import time
 import subprocess
 import os
+import queue
 from ..utils.utils import safe_addstr
 import concurrent.futures
 from datetime import datetime, timezone
 import json
+from collections import deque
+from functools import lru_cache
+from itertools import accumulate, compress, count, repeat
+from operator import contains, ne, not_
 
+# Quoted phrase (possibly unterminated), parenthesis, or bare word
+FILTER_TOKEN_RE = re.compile(r'"([^"]*)("?)|([()])|([^ ()"]+)')
+
+@lru_cache(maxsize=32)
 def parse_filter_expression(filter_string):
     """Parse filter expression with AND/OR operators and parentheses
     
-    Returns a parsed structure that can be evaluated against log lines.
+    Returns a tuple of (type, value) tokens that can be evaluated against
+    log lines. Results are memoized since the same filter is re-applied on
+    every follow-mode refresh.
     Supports:
     - Basic terms: word, +word (include), -word/!word (exclude)
     - AND operator: word AND word
@@ -28,60 +44,31 @@ def parse_filter_expression(filter_string):
     if not filter_string:
         return None
     
-    # Tokenize the filter string
+    # Tokenize the filter string in one regex pass
     tokens = []
-    current_token = ""
-    in_quotes = False
-    i = 0
-    
-    while i < len(filter_string):
-        char = filter_string[i]
-        
-        if char == '"':
-            if in_quotes:
-                # End of quoted string
-                if current_token:
-                    tokens.append(('TERM', current_token))
-                    current_token = ""
-                in_quotes = False
-            else:
-                # Start of quoted string
-                if current_token:
-                    tokens.append(('TERM', current_token))
-                    current_token = ""
-                in_quotes = True
-        elif char == ' ' and not in_quotes:
-            if current_token:
-                # Check if it's an operator
-                if current_token.upper() == 'AND':
-                    tokens.append(('AND', 'AND'))
-                elif current_token.upper() == 'OR':
-                    tokens.append(('OR', 'OR'))
-                else:
-                    tokens.append(('TERM', current_token))
-                current_token = ""
-        elif char == '(' and not in_quotes:
-            if current_token:
-                tokens.append(('TERM', current_token))
-                current_token = ""
-            tokens.append(('LPAREN', '('))
-        elif char == ')' and not in_quotes:
-            if current_token:
-                tokens.append(('TERM', current_token))
-                current_token = ""
-            tokens.append(('RPAREN', ')'))
-        else:
-            current_token += char
-        i += 1
-    
-    # Add the last token
-    if current_token:
-        if current_token.upper() == 'AND':
+    for match in FILTER_TOKEN_RE.finditer(filter_string):
+        quoted, closed, paren, word = match.groups()
+        if paren:
+            tokens.append(('LPAREN' if paren == '(' else 'RPAREN', paren))
+            continue
+        if quoted is not None:
+            if closed:
+                # A closed quote is always a literal term, even "AND"
+                if quoted:
+                    tokens.append(('TERM', quoted))
+                continue
+            # An unterminated quote runs to the end like a trailing word
+            word = quoted
+        elif match.end() < len(filter_string) and filter_string[match.end()] != ' ':
+            # Words cut short by a quote or paren are never operators
+            tokens.append(('TERM', word))
+            continue
+        if word.upper() == 'AND':
             tokens.append(('AND', 'AND'))
-        elif current_token.upper() == 'OR':
+        elif word.upper() == 'OR':
             tokens.append(('OR', 'OR'))
-        else:
-            tokens.append(('TERM', current_token))
+        elif word:
+            tokens.append(('TERM', word))
     
     # If no operators, treat as implicit AND between terms
     if not any(t[0] in ('AND', 'OR') for t in tokens):
@@ -95,48 +82,139 @@ def parse_filter_expression(filter_string):
                 new_tokens.append(('AND', 'AND'))
         tokens = new_tokens
     
-    return tokens
+    return tuple(tokens)
 
-def evaluate_filter(tokens, line, case_sensitive=False):
-    """Evaluate parsed filter tokens against a log line
+def compile_filter_term(term, case_sensitive=False):
+    """Compile a single filter term into an (exclude, needle) pair
     
-    Uses a simple recursive descent parser to evaluate the expression.
+    Terms are plain literals, so matching is a substring test rather than a
+    regex search. For case-insensitive filters the needle is lowercased and
+    must be tested against a lowercased line. The needle is None for bare
+    operators like '+' or '-', which match everything.
     """
-    if not tokens:
-        return True
+    # Handle exclusion operators
+    if term.startswith('!') or term.startswith('-'):
+        exclude = True
+        search_term = term[1:]
+    # Handle explicit inclusion
+    elif term.startswith('+'):
+        exclude = False
+        search_term = term[1:]
+    else:
+        exclude = False
+        search_term = term
     
-    flags = 0 if case_sensitive else re.IGNORECASE
+    if not search_term:
+        return exclude, None
+    return exclude, search_term if case_sensitive else search_term.lower()
+
+def compile_filter(tokens, case_sensitive=False):
+    """Precompile the TERM tokens of a parsed filter
     
-    def evaluate_term(term, line):
-        """Evaluate a single term against the line"""
-        # Handle exclusion operators
-        if term.startswith('!') or term.startswith('-'):
-            search_term = term[1:]
-            if search_term:
-                pattern = re.compile(re.escape(search_term), flags)
-                return not pattern.search(line)
-            return True
-        # Handle explicit inclusion
-        elif term.startswith('+'):
-            search_term = term[1:]
+    Returns a token tuple of the same shape where each TERM value is an
+    (exclude, needle) pair, so terms are prepared once per filter rather
+    than once per line.
+    """
+    if not tokens:
+        return tokens
+    
+    compiled = []
+    for token_type, token_value in tokens:
+        if token_type == 'TERM' and isinstance(token_value, str):
+            compiled.append((token_type, compile_filter_term(token_value, case_sensitive)))
         else:
-            search_term = term
-        
-        if search_term:
-            pattern = re.compile(re.escape(search_term), flags)
-            return bool(pattern.search(line))
-        return True
+            compiled.append((token_type, token_value))
+    return tuple(compiled)
+
+@lru_cache(maxsize=32)
+def get_compiled_filter(filter_string, case_sensitive=False):
+    """Parse and compile a filter string, memoized per (filter, case) pair"""
+    return compile_filter(parse_filter_expression(filter_string), case_sensitive)
+
+def get_lowered_logs(logs, lower_cache):
+    """Return a lowercased shadow copy of logs for case-insensitive matching
     
+    lower_cache is a dict owned by the caller, keyed by id(logs). A list that
+    has only grown since it was last seen (follow mode appends) is extended
+    with just its new lines instead of being lowercased again.
+    """
+    entry = lower_cache.get(id(logs))
+    if entry is not None and entry[0] is logs and len(entry[1]) <= len(logs):
+        lowered = entry[1]
+        if len(lowered) < len(logs):
+            lowered.extend(line.lower() for line in logs[len(lowered):])
+        return lowered
+    
+    # Keep only a handful of shadow copies (original, filtered, ...) alive
+    while len(lower_cache) >= 4:
+        del lower_cache[next(iter(lower_cache))]
+    lowered = [line.lower() for line in logs]
+    lower_cache[id(logs)] = (logs, lowered)
+    return lowered
+
+def get_joined_logs(haystacks, join_cache):
+    """Return haystacks joined by newlines plus the start offset of each line
+    
+    join_cache is a dict owned by the caller, keyed like get_lowered_logs.
+    A list that has only grown is extended rather than joined again.
+    """
+    key = ('joined', id(haystacks))
+    entry = join_cache.get(key)
+    if entry is not None and entry[0] is haystacks and entry[1] <= len(haystacks):
+        _, count, joined, line_starts = entry
+        if count < len(haystacks):
+            new_lines = haystacks[count:]
+            start = len(joined) + 1 if count else 0
+            line_starts.extend(accumulate((len(line) + 1 for line in new_lines[:-1]), initial=start))
+            joined = joined + "\n" + "\n".join(new_lines) if count else "\n".join(new_lines)
+            join_cache[key] = (haystacks, len(haystacks), joined, line_starts)
+        return joined, line_starts
+    
+    while len(join_cache) >= 4:
+        del join_cache[next(iter(join_cache))]
+    line_starts = array.array('q', accumulate((len(line) + 1 for line in haystacks[:-1]), initial=0)) if haystacks else array.array('q')
+    joined = "\n".join(haystacks)
+    join_cache[key] = (haystacks, len(haystacks), joined, line_starts)
+    return joined, line_starts
+
+def scan_joined_logs(needle, joined, line_starts, limit):
+    """Return the set of line indices containing needle by scanning the joined buffer
+    
+    One str.find per matching line, with bisect mapping each hit back to its
+    line, so lines without a match cost nothing in Python. Gives up and
+    returns None once more than limit lines match.
+    """
+    matched = set()
+    find = joined.find
+    locate = bisect.bisect_right
+    last_line = len(line_starts) - 1
+    pos = find(needle)
+    while pos != -1:
+        if len(matched) >= limit:
+            return None
+        line_idx = locate(line_starts, pos) - 1
+        matched.add(line_idx)
+        # One hit per line is enough, so resume at the next line
+        pos = find(needle, line_starts[line_idx + 1]) if line_idx < last_line else -1
+    return matched
+
+def _reduce_filter(tokens, evaluate_term, match_all):
+    """Evaluate a token sequence with a simple recursive descent parser
+    
+    Term results are combined with & and |, so the same walk evaluates a
+    single line (booleans) or a whole batch of lines (sets of indices).
+    match_all is the result for an empty or malformed sub-expression.
+    """
     def parse_expression(pos=0):
         """Parse and evaluate expression starting at position pos"""
         if pos >= len(tokens):
-            return True, pos
+            return match_all, pos
         
         # Parse primary expression (term or parenthesized expression)
         token_type, token_value = tokens[pos]
         
         if token_type == 'TERM':
-            result = evaluate_term(token_value, line)
+            result = evaluate_term(token_value)
             pos += 1
         elif token_type == 'LPAREN':
             # Parse expression inside parentheses
@@ -144,7 +222,7 @@ def evaluate_filter(tokens, line, case_sensitive=False):
             if pos < len(tokens) and tokens[pos][0] == 'RPAREN':
                 pos += 1  # Skip closing paren
         else:
-            return True, pos
+            return match_all, pos
         
         # Handle operators
         while pos < len(tokens):
@@ -154,14 +232,14 @@ def evaluate_filter(tokens, line, case_sensitive=False):
                 pos += 1
                 if pos < len(tokens):
                     right_result, pos = parse_expression(pos)
-                    result = result and right_result
+                    result = result & right_result
                 else:
                     break
             elif token_type == 'OR':
                 pos += 1
                 if pos < len(tokens):
                     right_result, pos = parse_expression(pos)
-                    result = result or right_result
+                    result = result | right_result
                 else:
                     break
             elif token_type == 'RPAREN':
@@ -175,8 +253,193 @@ def evaluate_filter(tokens, line, case_sensitive=False):
     result, _ = parse_expression()
     return result
 
+def evaluate_filter(tokens, line, case_sensitive=False, line_lowered=None):
+    """Evaluate parsed filter tokens against a log line
+    
+    Accepts either raw tokens from parse_filter_expression or tokens
+    precompiled with compile_filter. line_lowered may carry a precomputed
+    lowercase copy of the line for case-insensitive filters.
+    """
+    if not tokens:
+        return True
+    
+    # Lowercase the line once; compiled needles are already lowercased
+    if not case_sensitive:
+        line = line_lowered if line_lowered is not None else line.lower()
+    
+    def evaluate_term(term):
+        """Evaluate a single term against the line"""
+        if isinstance(term, str):
+            term = compile_filter_term(term, case_sensitive)
+        exclude, needle = term
+        if needle is None:
+            return True
+        found = needle in line
+        return not found if exclude else found
+    
+    return _reduce_filter(tokens, evaluate_term, True)
+
+def _match_term_batch(needle, haystacks, joined=None):
+    """Return the set of line indices whose haystack contains needle"""
+    if joined is not None:
+        # Rare terms: only the matching lines are visited
+        matched = scan_joined_logs(needle, joined[0], joined[1], max(len(haystacks) // 64, 64))
+        if matched is not None:
+            return matched
+    return set(compress(range(len(haystacks)), map(contains, haystacks, repeat(needle))))
+
+def _is_plain_conjunction(tokens):
+    """True for TERM AND TERM ... sequences, e.g. the implicit AND of 'foo +bar -baz'"""
+    return len(tokens) % 2 == 1 and all(
+        token[0] == ('AND' if i % 2 else 'TERM') for i, token in enumerate(tokens))
+
+def _is_plain_disjunction(tokens):
+    """True for TERM OR TERM ... sequences of include terms, e.g. 'error OR warn'"""
+    return len(tokens) % 2 == 1 and all(
+        token[0] == ('OR' if i % 2 else 'TERM') for i, token in enumerate(tokens)) and all(
+        not exclude and needle is not None for exclude, needle in (value for _, value in tokens[::2]))
+
+def _evaluate_disjunction_batch(tokens, needles, haystacks, joined=None):
+    """Evaluate include terms joined by OR
+    
+    When every term is rare enough for the joined-buffer scan, only the
+    matching lines are visited and their sets are united. Otherwise the
+    compiled predicate tests each line once, which beats scanning every
+    line once per term.
+    """
+    if joined is not None:
+        matched = set()
+        limit = max(len(haystacks) // 64, 64)
+        for needle in needles:
+            hits = scan_joined_logs(needle, joined[0], joined[1], limit)
+            if hits is None:
+                break
+            matched |= hits
+        else:
+            return sorted(matched)
+    return list(compress(range(len(haystacks)), map(get_filter_predicate(tokens), haystacks)))
+
+def _evaluate_conjunction_batch(terms, haystacks, joined=None):
+    """Evaluate a plain conjunction of compiled terms, narrowing as it goes
+    
+    The first include term is matched against the whole buffer; every later
+    term is only tested against the lines that survived so far, so K terms
+    cost one full scan plus K-1 scans of a shrinking candidate list.
+    """
+    # Include terms narrow the fastest, so apply them before exclusions
+    terms = sorted((term for term in terms if term[1] is not None), key=lambda term: term[0])
+    if not terms:
+        return list(range(len(haystacks)))
+    
+    exclude, needle = terms[0]
+    matched = _match_term_batch(needle, haystacks, joined)
+    if exclude:
+        candidates = [i for i in range(len(haystacks)) if i not in matched]
+    else:
+        candidates = sorted(matched)
+    
+    fetch = haystacks.__getitem__
+    for exclude, needle in terms[1:]:
+        if not candidates:
+            break
+        hits = map(contains, map(fetch, candidates), repeat(needle))
+        candidates = list(compress(candidates, map(not_, hits) if exclude else hits))
+    return candidates
+
+def filter_refines(tokens, previous):
+    """True when every line matching tokens is known to match previous as well
+    
+    Only plain conjunctions are compared: each earlier include term must be
+    contained in some new include term (typing more of a word, or adding a
+    +term) and each earlier exclude term must still be excluded by a new
+    exclude term that is a substring of it.
+    """
+    if not (tokens and previous and _is_plain_conjunction(tokens) and _is_plain_conjunction(previous)):
+        return False
+    
+    new_terms = [value for _, value in tokens[::2] if value[1] is not None]
+    includes = [needle for exclude, needle in new_terms if not exclude]
+    excludes = [needle for exclude, needle in new_terms if exclude]
+    for exclude, needle in (value for _, value in previous[::2]):
+        if needle is None:
+            continue
+        if exclude:
+            if not any(term in needle for term in excludes):
+                return False
+        elif not any(needle in term for term in includes):
+            return False
+    return True
+
+class _FilterSource(str):
+    """Python source for a filter sub-expression, combined by _reduce_filter
+    
+    Runs of the same operator are emitted flat ("a and b and c"), since
+    and/or are associative; parentheses only go around an operand built
+    with the other operator. Deeply nested source would hit the parser's
+    nesting limit on long filters.
+    """
+    op = None
+    
+    def _combine(self, other, op):
+        parts = [part if part.op in (None, op) else f"({part})" for part in (self, other)]
+        source = _FilterSource(f" {op} ".join(parts))
+        source.op = op
+        return source
+    
+    def __and__(self, other):
+        return self._combine(other, 'and')
+    
+    def __or__(self, other):
+        return self._combine(other, 'or')
+
+def _filter_term_source(term):
+    """Source testing one compiled (exclude, needle) term against `line`"""
+    exclude, needle = term
+    if needle is None:
+        return _FilterSource("True")
+    return _FilterSource(f"({needle!r} {'not in' if exclude else 'in'} line)")
+
+@lru_cache(maxsize=32)
+def get_filter_predicate(tokens):
+    """Compile filter tokens into a single-line predicate, memoized per filter
+    
+    The expression is walked once with the same parser as evaluate_filter
+    and emitted as one lambda with the needles baked in as literals, so
+    each line costs a single call with inlined `in` tests.
+    """
+    source = _reduce_filter(tokens, _filter_term_source, _FilterSource("True"))
+    try:
+        return eval(f"lambda line: {source}", {"__builtins__": {}})
+    except (SyntaxError, MemoryError, RecursionError):
+        # Too deeply nested for the parser (long alternating AND/OR chains);
+        # walk the tokens per line instead. Haystacks arrive already lowered
+        return lambda line: evaluate_filter(tokens, line, case_sensitive=True)
+
+def evaluate_filter_batch(tokens, haystacks, joined=None):
+    """Evaluate compiled filter tokens against many lines at once
+    
+    haystacks must already be lowercased for case-insensitive filters.
+    Plain conjunctions and disjunctions narrow a candidate list term by
+    term (map/compress over str.__contains__), and joined may carry
+    get_joined_logs(haystacks) so rare terms are found by scanning the
+    joined buffer. Any other expression runs its compiled predicate over
+    every line in a single C-level pass.
+    Returns the sorted indices of matching lines.
+    """
+    if tokens and _is_plain_conjunction(tokens):
+        return _evaluate_conjunction_batch([value for _, value in tokens[::2]], haystacks, joined)
+    if tokens and _is_plain_disjunction(tokens):
+        return _evaluate_disjunction_batch(tokens, [needle for _, (_, needle) in tokens[::2]], haystacks, joined)
+    
+    if not tokens:
+        return list(range(len(haystacks)))
+    
+    # Mixed AND/OR/paren expressions: one C-level pass calling the predicate
+    return list(compress(range(len(haystacks)), map(get_filter_predicate(tokens), haystacks)))
+
+@lru_cache(maxsize=8)
 def get_filter_indicator(filter_string):
-    """Generate a concise filter indicator for the header"""
+    """Generate a concise filter indicator for the header (memoized per filter string)"""
     if not filter_string:
         return ""
     
@@ -186,11 +449,179 @@ def get_filter_indicator(filter_string):
     else:
         return f" [FILTER: {filter_string}] "
 
-def normalize_container_logs(normalize_logs, normalize_script, log_lines):
-    """Pipe logs through normalize_logs.py script"""
+@lru_cache(maxsize=32)
+def render_header(container_name, follow_mode, normalize_logs, wrap_log_lines, tail_lines, search_string, filter_string):
+    """Build the log view header text (memoized per view state)"""
+    return (f" Logs: {container_name} "
+            + (" [FOLLOW]" if follow_mode else " [STATIC]")
+            + (" [NORMALIZED]" if normalize_logs else " [RAW]")
+            + (" [WRAP]" if wrap_log_lines else " [NOWRAP]")
+            + f" [TAIL: {tail_lines if tail_lines > 0 else 'ALL'}]"
+            + (f" [SEARCH: {search_string}]" if search_string else "")
+            + get_filter_indicator(filter_string))
+
+# Footer help text keyed by (filter or time filter active, wrap_log_lines)
+LOG_VIEW_FOOTERS = {
+    (True, True): " ↑/↓:Scroll | F:Follow | R:Time | E:Export | /:Search | \\:Filter | ESC:Clear | Q:Back ",
+    (True, False): " ↑/↓:Scroll | ←/→:H-Scroll | F:Follow | R:Time | E:Export | /:Search | \\:Filter | ESC:Clear | Q:Back ",
+    (False, True): " ↑/↓:Scroll | PgUp/Dn | F:Follow | N:Normalize | W:Wrap | T:Tail | R:Time | E:Export | /:Search | \\:Filter | ESC:Back ",
+    (False, False): " ↑/↓:Scroll | ←/→:H-Scroll | PgUp/Dn | F:Follow | N:Normalize | W:Wrap | T:Tail | R:Time | E:Export | /:Search | \\:Filter | ESC:Back ",
+}
+
+# Mouse button masks checked by the log view, resolved once at import
+MOUSE_WHEEL_UP = curses.BUTTON4_PRESSED
+MOUSE_WHEEL_DOWN = curses.BUTTON5_PRESSED
+MOUSE_WHEEL_LEFT = 1 << 8  # Horizontal wheel, as reported by xterm-style terminals
+MOUSE_WHEEL_RIGHT = 1 << 9
+MOUSE_CLICK = curses.BUTTON1_CLICKED
+
+# Static parts of the search and filter prompt rows
+SEARCH_PROMPT = " Search: "
+FILTER_PROMPT = " Filter: "
+SEARCH_CASE_TEXT = {True: "Case: ON (Tab)", False: "Case: OFF (Tab)"}
+FILTER_CASE_TEXT = {True: "Case: ON", False: "Case: OFF"}
+FILTER_HELP_TEXT = "Syntax: term AND/OR term, (term OR term), +include -exclude \"multi word\" | Tab:Case"
+
+# Marks the end of a batch sent to a long-running normalize_logs.py process
+NORMALIZE_BATCH_SENTINEL = "<<<EOB>>>"
+# Raw -> normalized lines remembered per log view; cleared when it grows past this
+NORMALIZE_CACHE_LINES = 50000
+
+def _start_normalize_process(tui, normalize_script):
+    """Return the persistent normalize_logs.py process for tui, spawning it if needed"""
+    process = getattr(tui, '_normalize_proc', None)
+    if process is not None and process.poll() is None:
+        return process
+    
+    # Make sure normalize_logs.py is executable
+    if not os.access(normalize_script, os.X_OK):
+        os.chmod(normalize_script, 0o755)
+    
+    # Binary pipes so output can be read with select() and a deadline
+    process = subprocess.Popen(
+        [normalize_script],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        env=dict(os.environ, PYTHONIOENCODING='utf-8')
+    )
+    tui._normalize_proc = process
+    return process
+
+def close_normalize_process(tui):
+    """Stop the persistent normalize_logs.py process, if one is running"""
+    process = getattr(tui, '_normalize_proc', None)
+    writer = getattr(tui, '_normalize_writer', None)
+    tui._normalize_proc = None
+    tui._normalize_writer = None
+    tui._normalize_cache = None
+    if process is None:
+        return
+    if writer is not None and writer.is_alive():
+        # A timed-out batch is still blocked writing stdin, and closing the
+        # pipe would wait on that write; kill first so the write fails
+        process.kill()
+        writer.join(timeout=1)
+    else:
+        try:
+            process.stdin.close()
+            process.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+    if process.poll() is None:
+        process.kill()
+    process.wait()
+    
+    # Leave stdin to the garbage collector if the writer never let go of it
+    pipes = (process.stdout,) if writer is not None and writer.is_alive() else (process.stdin, process.stdout)
+    for pipe in pipes:
+        try:
+            pipe.close()
+        except OSError:
+            pass
+
+def _write_normalize_batch(stream, payload):
+    """Feed one batch to the normalizer (runs in a thread to avoid pipe deadlock)"""
+    try:
+        stream.write(payload)
+        stream.flush()
+    except (BrokenPipeError, ValueError, OSError):
+        pass
+
+def _normalize_with_process(tui, normalize_script, log_lines, timeout):
+    """Send one batch through the persistent normalizer and read until the sentinel echoes back"""
+    process = _start_normalize_process(tui, normalize_script)
+    sentinel = (NORMALIZE_BATCH_SENTINEL + "\n").encode()
+    payload = ("\n".join(log_lines) + "\n").encode('utf-8', errors='replace') + sentinel
+    
+    writer = threading.Thread(target=_write_normalize_batch, args=(process.stdin, payload), daemon=True)
+    writer.start()
+    tui._normalize_writer = writer
+    
+    fd = process.stdout.fileno()
+    output = bytearray()
+    deadline = time.monotonic() + timeout
+    # Only one batch is in flight, so the sentinel is always the last output line
+    while not output.endswith(sentinel):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise subprocess.TimeoutExpired(normalize_script, timeout)
+        ready, _, _ = select.select([fd], [], [], remaining)
+        if not ready:
+            continue
+        chunk = os.read(fd, 65536)
+        if not chunk:
+            raise subprocess.SubprocessError("normalize_logs.py exited unexpectedly")
+        output += chunk
+    
+    writer.join()
+    return output[:-len(sentinel)].decode('utf-8', errors='replace').splitlines()
+
+def _normalize_cached(tui, normalize_script, log_lines, timeout):
+    """Normalize log_lines, sending only lines the normalizer has not seen before
+    
+    Results are remembered per raw line on tui, so toggling normalization
+    back on and repeated lines cost a dict lookup instead of a round trip.
+    """
+    cache = getattr(tui, '_normalize_cache', None)
+    if cache is None:
+        cache = tui._normalize_cache = {}
+    
+    misses = list(dict.fromkeys(line for line in log_lines if line not in cache))
+    if misses:
+        normalized = _normalize_with_process(tui, normalize_script, misses, timeout)
+        if len(normalized) != len(misses):
+            # Some line came out as several, so results cannot be matched to lines
+            if len(misses) == len(log_lines):
+                return normalized
+            return _normalize_with_process(tui, normalize_script, log_lines, timeout)
+        cache.update(zip(misses, normalized))
+    
+    result = list(map(cache.__getitem__, log_lines))
+    if len(cache) > NORMALIZE_CACHE_LINES:
+        cache.clear()
+    return result
+
+def normalize_container_logs(normalize_logs, normalize_script, log_lines, tui=None):
+    """Pipe logs through normalize_logs.py script
+    
+    When tui is given, batches go through one long-running normalizer process
+    stored on it instead of paying a fork+exec per batch, and lines it has
+    already normalized are answered from a per-line cache.
+    """
     if not normalize_logs or not os.path.isfile(normalize_script):
         return log_lines
     
+    if tui is not None:
+        if not log_lines:
+            return log_lines
+        try:
+            return _normalize_cached(tui, normalize_script, log_lines, timeout=3)
+        except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError) as e:
+            # Drop the process; the next batch respawns it
+            close_normalize_process(tui)
+            return [f"Log normalization error: {str(e)}", "Showing raw logs instead."] + log_lines
+    
     try:
         # Join log lines with newlines to create input
         log_text = "\n".join(log_lines)
@@ -213,10 +644,7 @@ def normalize_container_logs(normalize_logs, normalize_script, log_lines):
         
         # Check if there was an error
         if process.returncode != 0 or stderr:
-            error_logs = log_lines.copy()
-            error_logs.insert(0, f"Log normalization error: {stderr.strip()}")
-            error_logs.insert(1, "Showing raw logs instead.")
-            return error_logs
+            return [f"Log normalization error: {stderr.strip()}", "Showing raw logs instead."] + log_lines
         
         # Split output into lines and return
         normalized_logs = stdout.splitlines()
@@ -224,95 +652,277 @@ def normalize_container_logs(normalize_logs, normalize_script, log_lines):
         
     except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError) as e:
         # Handle subprocess errors
-        error_logs = log_lines.copy()
-        error_logs.insert(0, f"Log normalization error: {str(e)}")
-        error_logs.insert(1, "Showing raw logs instead.")
-        return error_logs
-
-def rebuild_log_pad(logs, width, height, wrap_log_lines):
-    """Rebuild the log pad with current wrapping and normalization settings"""
-    # Handle empty logs case
-    if not logs:
-        # Create a minimal pad for empty state
-        new_pad = curses.newpad(10, max(width-2, 10))
-        return {
-            'pad': new_pad,
-            'line_positions': [],
-            'actual_lines': 0
-        }
-    
-    # Estimate pad size needed
-    pad_height = max(len(logs)+100, 500)
-    
-    # If wrapping is enabled, we might need more space
+        return [f"Log normalization error: {str(e)}", "Showing raw logs instead."] + log_lines
+
+# ncurses refuses to create or resize pads of 32768 rows or more
+MAX_PAD_ROWS = 32767
+
+def pad_capacity_for(rows):
+    """Round a pad row count up to the next power of two (minimum 1024), capped at MAX_PAD_ROWS"""
+    return min(max(1 << max(rows - 1, 0).bit_length(), 1024), MAX_PAD_ROWS)
+
+def estimate_pad_rows(lengths, width, wrap_log_lines):
+    """Pad rows needed to draw lines with the given lengths"""
+    if not wrap_log_lines:
+        return len(lengths)
+    step = width - 3
+    # Every line takes one row, plus one per extra wrapped segment
+    return len(lengths) + sum((length - 1) // step for length in lengths if length > step)
+
+# Control characters (other than newline) that curses does not draw as one cell
+_PAD_UNSAFE_CHARS = re.compile(r'[\x00-\x09\x0b-\x1f\x7f]')
+
+def write_lines_to_pad(pad, line_positions, current_line, lines, width, wrap_log_lines):
+    """Draw lines into the pad starting at current_line, returning the next free row"""
+    step = width - 3
     if wrap_log_lines:
-        # Roughly estimate how many extra lines we might need for wrapping
-        extra_lines = sum(max(1, len(line) // (width-3)) for line in logs)
-        pad_height += extra_lines
+        # Slice the wrapped segments in one pass; an empty line still takes a row
+        rows = []
+        for line in lines:
+            line_positions.append(current_line + len(rows))
+            rows.extend([line[i:i+step] for i in range(0, max(len(line), 1), step)])
+    else:
+        # No wrapping - one row per line
+        line_positions.extend(range(current_line, current_line + len(lines)))
+        rows = lines
+    
+    # Draw the whole batch with one addstr; each newline moves to the next pad row.
+    # Only plain ASCII is batched: tabs, control and wide characters can take
+    # more cells than characters and would spill into the following row.
+    text = "\n".join(rows)
+    if text.isascii() and not _PAD_UNSAFE_CHARS.search(text):
+        try:
+            pad.addstr(current_line, 0, text)
+            return current_line + len(rows)
+        except curses.error:
+            pass
+    
+    # Row by row, so one row curses rejects does not stop the rest
+    for offset, row in enumerate(rows):
+        try:
+            pad.addstr(current_line + offset, 0, row)
+        except curses.error:
+            pass
+    return current_line + len(rows)
+
+def repaint_changed_rows(pad_info, logs, width, wrap_log_lines):
+    """Redraw only the rows of logs that differ from the lines already on the pad
+    
+    Lines before the first difference keep their rows. Without wrapping and
+    with the same line count every line keeps its row, so only changed lines
+    are redrawn. Returns the new line_positions and row count, or None when
+    too much changed to beat a full redraw.
+    """
+    old_lines = pad_info['lines']
+    pad = pad_info['pad']
+    if not wrap_log_lines and len(old_lines) == len(logs):
+        dirty = list(compress(count(), map(ne, old_lines, logs)))
+        if len(dirty) > len(logs) // 2:
+            return None
+        for i in dirty:
+            pad.move(i, 0)
+            pad.clrtoeol()
+            write_lines_to_pad(pad, array.array('i'), i, logs[i:i+1], width, False)
+        return pad_info['line_positions'], pad_info['actual_lines']
+    
+    first = next(compress(count(), map(ne, old_lines, logs)), min(len(old_lines), len(logs)))
+    if first < len(logs) // 2:
+        return None
+    line_positions = pad_info['line_positions'][:first]
+    kept_rows = pad_info['line_positions'][first] if first < len(old_lines) else pad_info['actual_lines']
+    pad.move(kept_rows, 0)
+    pad.clrtobot()
+    return line_positions, write_lines_to_pad(pad, line_positions, kept_rows, logs[first:], width, wrap_log_lines)
+
+def rebuild_log_pad(logs, width, height, wrap_log_lines, reuse=None, known_max_len=None):
+    """Rebuild the log pad with current wrapping and normalization settings
+    
+    reuse may be the pad_info of the pad on screen. Its pad is redrawn in
+    place, and only resized when the logs no longer fit or would leave most
+    of it unused. When the layout is unchanged only the rows whose lines
+    changed are redrawn, unless the pad is marked 'highlighted' (its rows
+    may carry search highlight attributes). known_max_len may carry the
+    longest line length when the caller already knows it (same lines in
+    another layout); unwrapped pads then skip measuring the lines.
+    """
+    # Measure every line once; row count and width both derive from it
+    if known_max_len is not None and not wrap_log_lines:
+        lengths = logs  # Only its length is needed for the row count
+        max_line_length = known_max_len
+    else:
+        lengths = array.array('i', map(len, logs))
+        max_line_length = max(lengths, default=0) if known_max_len is None else known_max_len
+    
+    # Size the pad with headroom so follow mode can append without rebuilding
+    needed = pad_capacity_for(estimate_pad_rows(lengths, width, wrap_log_lines) + 100) if logs else 10
     
-    # Create new pad with appropriate dimensions
+    # Pad dimensions
     pad_width = max(width-2, 10)
     if not wrap_log_lines:
         # For non-wrapped mode, make pad wider to accommodate long lines
-        pad_width = max(pad_width, max((len(line) for line in logs), default=width) + 10)
-        
-    new_pad = curses.newpad(pad_height, pad_width)
-    
-    # Fill pad with logs - handle wrapping
-    line_positions = []  # Track the starting position of each logical line
-    current_line = 0
+        pad_width = max(pad_width, max_line_length + 10)
+    
+    repainted = None
+    if reuse is not None:
+        new_pad = reuse['pad']
+        capacity = reuse['capacity']
+        if needed > capacity or capacity > 4 * max(needed, 1024):
+            capacity = needed
+        if (capacity, pad_width) != new_pad.getmaxyx():
+            new_pad.resize(capacity, pad_width)
+        elif reuse['layout'] == (width, wrap_log_lines) and not reuse.get('highlighted'):
+            repainted = repaint_changed_rows(reuse, logs, width, wrap_log_lines)
+        if repainted is None:
+            new_pad.erase()
+    else:
+        capacity = needed
+        new_pad = curses.newpad(capacity, pad_width)
     
-    for i, line in enumerate(logs):
-        line_positions.append(current_line)
-        if wrap_log_lines:
-            # Split the line into wrapped segments
-            remaining = line
-            while remaining:
-                segment = remaining[:width-3]
-                try:
-                    new_pad.addstr(current_line, 0, segment)
-                except curses.error:
-                    pass
-                current_line += 1
-                remaining = remaining[width-3:]
-        else:
-            # No wrapping - just add the whole line
-            try:
-                new_pad.addstr(current_line, 0, line)
-            except curses.error:
-                pass
-            current_line += 1
+    if repainted is not None:
+        line_positions, current_line = repainted
+    else:
+        # Fill pad with logs - handle wrapping
+        # Track the starting pad row of each logical line (packed ints, indexed often)
+        line_positions = array.array('i')
+        current_line = write_lines_to_pad(new_pad, line_positions, 0, logs, width, wrap_log_lines)
     
-    # Return pad and metadata
+    # Return pad and metadata; lines is a snapshot of what the pad shows
+    # Rows past a full pad are not drawn, so never scroll beyond it
     return {
         'pad': new_pad,
         'line_positions': line_positions,
-        'actual_lines': current_line
+        'actual_lines': min(current_line, capacity),
+        'capacity': capacity,
+        'max_line_length': max_line_length,
+        'lines': list(logs),
+        'layout': (width, wrap_log_lines)
     }
 
-def search_and_highlight(pad, logs, search_pattern, line_positions, w, case_sensitive=False, start_pos=0):
-    """Find search matches and update the pad with highlights"""
+def swap_log_pad(logs, width, height, wrap_log_lines, current, spare, restore=True):
+    """Switch the pad to another wrap mode, keeping the pad it replaces as a spare
+    
+    spare is the (logs, line_count, width, wrap_log_lines, pad_info) tuple
+    returned by the previous call, or None. When it was built from the same,
+    unchanged logs for the requested mode it goes back on screen as is;
+    otherwise its pad is redrawn in place, so at most two pads exist. Pass
+    restore=False when the pads carry search highlights that may be stale.
+    Returns the pad_info to show and the new spare.
+    """
+    # The pad on screen shows these same lines, so their longest length is known
+    known_max_len = current['max_line_length'] if len(current['lines']) == len(logs) else None
+    if spare is None:
+        pad_info = rebuild_log_pad(logs, width, height, wrap_log_lines, known_max_len=known_max_len)
+    elif restore and spare[0] is logs and spare[1:4] == (len(logs), width, wrap_log_lines):
+        pad_info = spare[4]
+    else:
+        pad_info = rebuild_log_pad(logs, width, height, wrap_log_lines, spare[4], known_max_len)
+    return pad_info, (logs, len(logs), width, not wrap_log_lines, current)
+
+def append_to_pad(pad_info, new_lines, wrap_log_lines, width):
+    """Draw new lines at the bottom of an existing pad, doubling its capacity when full"""
+    pad = pad_info['pad']
+    current_line = pad_info['actual_lines']
+    capacity = pad_info['capacity']
+    pad_width = pad.getmaxyx()[1]
+    
+    lengths = array.array('i', map(len, new_lines))
+    if lengths:
+        pad_info['max_line_length'] = max(pad_info['max_line_length'], max(lengths))
+    pad_info['lines'].extend(new_lines)
+    
+    # Grow in place so lines already drawn are kept
+    needed = current_line + estimate_pad_rows(lengths, width, wrap_log_lines)
+    new_width = pad_width
+    if not wrap_log_lines:
+        new_width = max(pad_width, pad_info['max_line_length'] + 10)
+    if (needed >= capacity and capacity < MAX_PAD_ROWS) or new_width != pad_width:
+        if needed >= capacity:
+            capacity = pad_capacity_for(needed + 1)
+        pad.resize(capacity, new_width)
+        pad_info['capacity'] = capacity
+    
+    # A pad at MAX_PAD_ROWS stops growing; rows past its end are not drawn
+    pad_info['actual_lines'] = min(write_lines_to_pad(
+        pad, pad_info['line_positions'], current_line, new_lines, width, wrap_log_lines), capacity)
+    return pad_info
+
+def search_and_highlight(pad, logs, search_pattern, line_positions, w, case_sensitive=False, start_pos=0, lower_cache=None, search_cache=None):
+    """Find search matches and update the pad with highlights
+    
+    search_cache is an optional dict owned by the caller, holding the last
+    search of a handful of lists keyed by id(logs). Searching the same list
+    for the same pattern again (after a wrap toggle, a pad rebuild, or
+    switching a filter off and back on) reuses the previous matches,
+    scanning only lines appended since. lower_cache also keeps the joined
+    buffer a fresh search scans for matching lines.
+    """
     # Initialize search results
     search_matches = []
     
     if not search_pattern:
         return {'matches': search_matches, 'current_match': -1}
-        
-    # Find all matches in all lines
-    flags = 0 if case_sensitive else re.IGNORECASE
     
-    # Process each log line
-    for i, line in enumerate(logs):
-        # Find all matches in this line
-        for match in re.finditer(re.escape(search_pattern), line, flags):
-            # Get match position
-            start, end = match.span()
-            
+    scan_from = 0
+    key = (search_pattern, case_sensitive)
+    entry = search_cache.get(id(logs)) if search_cache is not None else None
+    if (entry is not None and entry['key'] == key
+            and entry['logs'] is logs and entry['scanned_upto'] <= len(logs)):
+        search_matches = entry['matches']
+        scan_from = entry['scanned_upto']
+    elif search_cache is not None:
+        # Keep only a handful of lists (original, filtered, ...) searched
+        search_cache.pop(id(logs), None)
+        while len(search_cache) >= 4:
+            del search_cache[next(iter(search_cache))]
+        entry = search_cache[id(logs)] = {'key': key, 'logs': logs, 'matches': search_matches}
+    
+    # The search pattern is a literal, so scan with str.find rather than regex
+    needle = search_pattern if case_sensitive else search_pattern.lower()
+    needle_len = len(needle)
+    
+    # Case-insensitive searches scan a lowercased copy of the lines not yet searched
+    if scan_from == len(logs):
+        haystacks = ()
+    elif case_sensitive:
+        haystacks = logs[scan_from:] if scan_from else logs
+    elif lower_cache is not None:
+        haystacks = get_lowered_logs(logs, lower_cache)
+        haystacks = haystacks[scan_from:] if scan_from else haystacks
+    else:
+        haystacks = [line.lower() for line in logs[scan_from:]]
+    
+    # A fresh search first finds the matching lines in one joined buffer, so
+    # lines without a hit cost no Python work; common needles give up on that
+    # and fall back to scanning every line
+    rows = enumerate(haystacks, scan_from)
+    if not scan_from and lower_cache is not None and len(haystacks) > 1 and "\n" not in needle:
+        joined, line_starts = get_joined_logs(haystacks, lower_cache)
+        hit_lines = scan_joined_logs(needle, joined, line_starts, max(len(haystacks) // 64, 64))
+        if hit_lines is not None:
+            rows = ((i, haystacks[i]) for i in sorted(hit_lines))
+    
+    # Process each log line; matches come out ordered by line then position
+    find = str.find
+    append = search_matches.append
+    folded = None
+    for i, haystack in rows:
+        if not case_sensitive and len(haystack) != len(logs[i]):
+            # Lowercasing changed this line's length (e.g. "İ"), so offsets in
+            # the lowered copy are not columns of the original; search it directly
+            if folded is None:
+                folded = re.compile(re.escape(search_pattern), re.IGNORECASE)
+            for m in folded.finditer(logs[i]):
+                append((i, m.start(), m.end() - m.start()))
+            continue
+        
+        # Find all non-overlapping matches in this line
+        start = find(haystack, needle)
+        while start != -1:
             # Store the match with its logical line index and character position
-            search_matches.append((i, start, end - start))
-    
-    # Sort matches by logical line index then by position
-    search_matches.sort()
+            append((i, start, needle_len))
+            start = find(haystack, needle, start + needle_len)
+    if entry is not None:
+        entry['scanned_upto'] = len(logs)
     
     # Find closest match to current position
     current_match = -1
@@ -321,20 +931,12 @@ def search_and_highlight(pad, logs, search_pattern, line_positions, w, case_sens
         closest_idx = 0
         if start_pos > 0:
             # Convert start_pos to logical line
-            logical_line = 0
-            for i, pos in enumerate(line_positions):
-                if pos > start_pos:
-                    logical_line = i - 1
-                    break
-                if i == len(line_positions) - 1:
-                    logical_line = i
+            logical_line = logical_line_at(line_positions, start_pos)
             
-            # Find first match on or after logical_line
-            closest_idx = 0
-            for i, (match_line, _, _) in enumerate(search_matches):
-                if match_line >= logical_line:
-                    closest_idx = i
-                    break
+            # Find first match on or after logical_line, wrapping to the start
+            closest_idx = bisect.bisect_left(search_matches, (logical_line, 0, 0))
+            if closest_idx >= len(search_matches):
+                closest_idx = 0
         
         # Clamp to valid range
         current_match = max(0, min(closest_idx, len(search_matches) - 1))
@@ -345,56 +947,110 @@ def search_and_highlight(pad, logs, search_pattern, line_positions, w, case_sens
         'current_match': current_match
     }
 
-def highlight_search_matches(pad, line_positions, wrap_log_lines, w, search_matches, current_match):
-    """Draw search match highlights on the pad"""
-    if not search_matches:
-        return
+def logical_line_at(line_positions, pad_row):
+    """Index of the logical line drawn at pad_row (line_positions is ascending)"""
+    return max(0, bisect.bisect_right(line_positions, pad_row) - 1)
+
+def match_pad_position(line_positions, line_idx, char_pos, wrap_log_lines, w):
+    """Map a character offset within a logical line to a (pad_line, column) pair"""
+    if not wrap_log_lines:
+        return line_positions[line_idx], char_pos
     
-    # First pass: highlight all matches
-    for i, (line_idx, start_pos, length) in enumerate(search_matches):
-        # If in wrapped mode, find the actual pad line and position
-        if wrap_log_lines:
-            pad_line = line_positions[line_idx]
-            wrap_offset = 0
-            char_pos = 0
-            
-            # Calculate the actual position in the pad
-            while char_pos + (w-3) < start_pos:
-                pad_line += 1
-                char_pos += (w-3)
-            
-            # Calculate the starting position on this line
-            start_col = start_pos - char_pos
+    # Wrapped segments are all w-3 wide, so the segment index is a division
+    extra, col = divmod(char_pos, w - 3)
+    return line_positions[line_idx] + extra, col
+
+def repaint_match(pad, match, line_positions, wrap_log_lines, w, attr):
+    """Apply attr to the pad cells covered by a single search match"""
+    line_idx, start_pos, length = match
+    
+    # If in wrapped mode, find the actual pad line and position
+    if wrap_log_lines:
+        pad_line, start_col = match_pad_position(line_positions, line_idx, start_pos, wrap_log_lines, w)
+        
+        # Handle multiple wraps if the match spans multiple wrapped lines
+        remaining = length
+        while remaining > 0:
+            # How much can fit on this line
+            segment_length = min(remaining, (w-3) - start_col)
             
-            # Handle multiple wraps if the match spans multiple wrapped lines
-            remaining = length
-            while remaining > 0:
-                # How much can fit on this line
-                segment_length = min(remaining, (w-3) - start_col)
-                
-                # Draw this segment with the appropriate color
-                attr = curses.color_pair(10) if i == current_match else curses.color_pair(9)
-                try:
-                    for x in range(segment_length):
-                        # Change attribute for each character
-                        pad.chgat(pad_line, start_col + x, 1, attr)
-                except curses.error:
-                    pass
-                
-                # Move to next line if needed
-                remaining -= segment_length
-                if remaining > 0:
-                    pad_line += 1
-                    start_col = 0
-        else:
-            # Non-wrapped mode: simply highlight at the absolute position
-            attr = curses.color_pair(10) if i == current_match else curses.color_pair(9)
             try:
-                pad_line = line_positions[line_idx]
-                for x in range(length):
-                    pad.chgat(pad_line, start_pos + x, 1, attr)
+                # Change attribute for the whole segment in one call
+                pad.chgat(pad_line, start_col, segment_length, attr)
             except curses.error:
                 pass
+            
+            # Move to next line if needed
+            remaining -= segment_length
+            if remaining > 0:
+                pad_line += 1
+                start_col = 0
+    else:
+        # Non-wrapped mode: simply highlight at the absolute position
+        try:
+            pad_line = line_positions[line_idx]
+            pad.chgat(pad_line, start_pos, length, attr)
+        except curses.error:
+            pass
+
+def match_range_for_rows(search_matches, line_positions, first_row, last_row):
+    """Return the (lo, hi) slice of search_matches on lines that overlap pad rows first_row..last_row"""
+    # Include the line that starts above first_row but wraps into it
+    first_line = logical_line_at(line_positions, first_row)
+    end_line = bisect.bisect_right(line_positions, last_row)
+    # Matches are sorted (line, start, length) tuples, so (line,) sorts before them all
+    lo = bisect.bisect_left(search_matches, (first_line,))
+    hi = bisect.bisect_left(search_matches, (end_line,), lo)
+    return lo, hi
+
+def highlight_search_matches(pad, line_positions, wrap_log_lines, w, search_matches, current_match, rows=None):
+    """Draw search match highlights on the pad
+    
+    rows may be a (first_row, last_row) pad row range, in which case only
+    the matches that can be seen there are painted.
+    """
+    if not search_matches:
+        return
+    
+    lo, hi = 0, len(search_matches)
+    if rows is not None:
+        lo, hi = match_range_for_rows(search_matches, line_positions, rows[0], rows[1])
+    
+    match_attr = curses.color_pair(9)
+    current_attr = curses.color_pair(10)
+    for i in range(lo, hi):
+        attr = current_attr if i == current_match else match_attr
+        repaint_match(pad, search_matches[i], line_positions, wrap_log_lines, w, attr)
+
+# Highlights are painted lazily in blocks of this many pad rows
+HIGHLIGHT_CHUNK_ROWS = 256
+
+def highlight_visible_matches(pad, line_positions, wrap_log_lines, w, search_matches, current_match, painted_chunks, first_row, last_row):
+    """Paint highlights for pad rows first_row..last_row, skipping blocks already painted
+    
+    painted_chunks is a set owned by the caller and must be emptied whenever
+    the pad is redrawn or the matches change. Highlights stay on the pad once
+    painted, so scrolling only pays for blocks it has not seen yet.
+    """
+    if not search_matches:
+        return
+    
+    for chunk in range(first_row // HIGHLIGHT_CHUNK_ROWS, last_row // HIGHLIGHT_CHUNK_ROWS + 1):
+        if chunk not in painted_chunks:
+            chunk_start = chunk * HIGHLIGHT_CHUNK_ROWS
+            highlight_search_matches(pad, line_positions, wrap_log_lines, w, search_matches, current_match,
+                                     rows=(chunk_start, chunk_start + HIGHLIGHT_CHUNK_ROWS - 1))
+            painted_chunks.add(chunk)
+
+def move_current_match(pad, line_positions, wrap_log_lines, w, search_matches, old_match, new_match):
+    """Recolor only the previous and new current match after navigation"""
+    if not search_matches:
+        return
+    
+    if 0 <= old_match < len(search_matches) and old_match != new_match:
+        repaint_match(pad, search_matches[old_match], line_positions, wrap_log_lines, w, curses.color_pair(9))
+    if 0 <= new_match < len(search_matches):
+        repaint_match(pad, search_matches[new_match], line_positions, wrap_log_lines, w, curses.color_pair(10))
 
 def next_search_match(search_matches, current_match, line_positions, wrap_log_lines, w):
     """Move to the next search match and return position to scroll to"""
@@ -408,16 +1064,7 @@ def next_search_match(search_matches, current_match, line_positions, wrap_log_li
     line_idx, char_pos, _ = search_matches[new_match]
     
     # Convert to pad position
-    if wrap_log_lines:
-        # Calculate wrapped line position
-        pad_line = line_positions[line_idx]
-        wrap_width = w - 3
-        while char_pos >= wrap_width:
-            pad_line += 1
-            char_pos -= wrap_width
-    else:
-        # Just use the direct line position
-        pad_line = line_positions[line_idx]
+    pad_line, _ = match_pad_position(line_positions, line_idx, char_pos, wrap_log_lines, w)
         
     # Return the match position and index
     return {
@@ -437,16 +1084,7 @@ def prev_search_match(search_matches, current_match, line_positions, wrap_log_li
     line_idx, char_pos, _ = search_matches[new_match]
     
     # Convert to pad position
-    if wrap_log_lines:
-        # Calculate wrapped line position
-        pad_line = line_positions[line_idx]
-        wrap_width = w - 3
-        while char_pos >= wrap_width:
-            pad_line += 1
-            char_pos -= wrap_width
-    else:
-        # Just use the direct line position
-        pad_line = line_positions[line_idx]
+    pad_line, _ = match_pad_position(line_positions, line_idx, char_pos, wrap_log_lines, w)
         
     # Return the match position and index
     return {
@@ -454,24 +1092,62 @@ def prev_search_match(search_matches, current_match, line_positions, wrap_log_li
         'match_index': new_match
     }
 
-def filter_logs(logs, filter_string, case_sensitive=False):
-    """Filter logs with advanced expression support"""
+def filter_logs(logs, filter_string, case_sensitive=False, lower_cache=None, filter_cache=None):
+    """Filter logs with advanced expression support
+    
+    Returns the matching lines and an array('i') mapping each of them to its
+    index in logs; packed ints keep the map at 4 bytes per matching line.
+    filter_cache is an optional dict owned by the caller. When the same
+    filter is applied again to the same list after it has only grown (follow
+    mode appends), only the new lines are scanned and the cached results are
+    extended in place, so the returned lists are shared with the cache.
+    """
     if not filter_string:
-        return logs, list(range(len(logs)))  # Return original logs with mapping if no filter
+        return logs, array.array('i', range(len(logs)))  # Return original logs with mapping if no filter
     
-    # Parse the filter expression
-    tokens = parse_filter_expression(filter_string)
+    # Parse the filter expression and compile its terms (cached per filter)
+    tokens = get_compiled_filter(filter_string, case_sensitive)
     if not tokens:
-        return logs, []
+        return logs, array.array('i')
     
-    filtered_logs = []
-    line_map = []  # Maps filtered line index to original line index
+    # Case-insensitive filters match against a lowercased copy of the logs
+    if case_sensitive:
+        lowered = logs
+    elif lower_cache is not None:
+        lowered = get_lowered_logs(logs, lower_cache)
+    else:
+        lowered = [line.lower() for line in logs]
+    
+    # Same filter over the same, grown list: scan only the appended lines
+    key = (filter_string, case_sensitive)
+    if (filter_cache is not None and filter_cache.get('key') == key
+            and filter_cache['logs'] is logs and filter_cache['scanned_upto'] <= len(logs)):
+        start = filter_cache['scanned_upto']
+        if start < len(logs):
+            new_indices = evaluate_filter_batch(tokens, lowered[start:])
+            new_indices = [start + i for i in new_indices]
+            filter_cache['line_map'].extend(new_indices)
+            filter_cache['filtered'].extend(map(logs.__getitem__, new_indices))
+            filter_cache['scanned_upto'] = len(logs)
+        return filter_cache['filtered'], filter_cache['line_map']
+    
+    if (filter_cache is not None and filter_cache.get('key', (None, None))[1] == case_sensitive
+            and filter_cache['logs'] is logs and filter_cache['scanned_upto'] == len(logs)
+            and filter_refines(tokens, get_compiled_filter(filter_cache['key'][0], case_sensitive))):
+        # A narrower version of the previous filter only needs to look at its matches
+        candidates = filter_cache['line_map']
+        subset = evaluate_filter_batch(tokens, [lowered[i] for i in candidates])
+        line_map = array.array('i', map(candidates.__getitem__, subset))
+    else:
+        # The joined buffer is only worth building when it can be kept for reuse
+        joined = get_joined_logs(lowered, lower_cache) if lower_cache is not None else None
+        
+        # Evaluate every term over all lines in bulk
+        line_map = array.array('i', evaluate_filter_batch(tokens, lowered, joined))  # Maps filtered line index to original line index
+    filtered_logs = list(map(logs.__getitem__, line_map))
     
-    # Process each log line
-    for i, line in enumerate(logs):
-        if evaluate_filter(tokens, line, case_sensitive):
-            filtered_logs.append(line)
-            line_map.append(i)
+    if filter_cache is not None:
+        filter_cache.update(key=key, logs=logs, scanned_upto=len(logs), line_map=line_map, filtered=filtered_logs)
     
     return filtered_logs, line_map
 
@@ -678,6 +1354,132 @@ def convert_to_docker_time_format(time_str, reference_logs=None):
     # Return the datetime object directly - Docker API expects this, not a string!
     return parsed_time
 
+def split_docker_timestamp(line):
+    """Split the RFC3339 timestamp docker prepends to a line when timestamps=True"""
+    ts, sep, text = line.partition(' ')
+    if not sep or not ts.endswith('Z'):
+        return None, line
+    return ts, text
+
+def docker_timestamp_key(ts):
+    """Sortable key for a docker timestamp (docker trims trailing zeros from the nanoseconds)"""
+    base, _, frac = ts[:-1].partition('.')
+    return base + '.' + frac.ljust(9, '0')
+
+def docker_timestamp_to_epoch(ts):
+    """Convert a docker timestamp to a unix timestamp, truncated to microseconds"""
+    base, _, frac = ts[:-1].partition('.')
+    return calendar.timegm(time.strptime(base, "%Y-%m-%dT%H:%M:%S")) + int(frac[:6] or 0) / 1e6
+
+def fetch_container_logs(container, tail=None, since_iso=None):
+    """Fetch log lines and the docker timestamp of the newest one
+    
+    Lines are requested with timestamps=True so follow mode can resume right
+    after the last line it has seen; the timestamp prefix is stripped again.
+    docker's since is inclusive, so lines at or before since_iso are dropped.
+    """
+    log_params = {'timestamps': True}
+    if tail:
+        log_params['tail'] = tail
+    boundary_key = None
+    if since_iso:
+        log_params['since'] = docker_timestamp_to_epoch(since_iso)
+        boundary_key = docker_timestamp_key(since_iso)
+    
+    lines = []
+    last_iso = since_iso
+    for raw_line in container.logs(**log_params).decode(errors='ignore').splitlines():
+        ts, line = split_docker_timestamp(raw_line)
+        if ts:
+            if boundary_key and docker_timestamp_key(ts) <= boundary_key:
+                continue
+            last_iso = ts
+        lines.append(line)
+    return lines, last_iso
+
+def _pump_log_stream(state):
+    """Background thread: split the followed docker stream into lines and queue them"""
+    boundary_key = docker_timestamp_key(state['since_iso']) if state['since_iso'] else None
+    pending = b""
+    try:
+        for chunk in state['stream']:
+            pending += chunk
+            *complete, pending = pending.split(b"\n")
+            for raw_line in complete:
+                for text in raw_line.decode(errors='ignore').splitlines():
+                    ts, line = split_docker_timestamp(text)
+                    if ts and boundary_key:
+                        # docker's since is inclusive; skip what was already fetched
+                        if docker_timestamp_key(ts) <= boundary_key:
+                            continue
+                        boundary_key = None
+                    state['queue'].put((ts, line))
+    except Exception:
+        pass
+    finally:
+        state['alive'] = False
+
+def start_log_stream(tui, container, since_iso=None):
+    """Follow container logs on a daemon thread, replacing any previous stream
+    
+    New lines are queued as (timestamp, line) pairs for drain_log_stream.
+    Returns False when docker refuses the stream so callers keep polling.
+    """
+    stop_log_stream(tui)
+    log_params = {'stream': True, 'follow': True, 'timestamps': True}
+    if since_iso:
+        log_params['since'] = docker_timestamp_to_epoch(since_iso)
+    else:
+        # Nothing fetched yet, so only lines from now on are new
+        log_params['tail'] = 0
+    try:
+        stream = container.logs(**log_params)
+    except Exception:
+        return False
+    
+    state = {'stream': stream, 'queue': queue.SimpleQueue(), 'alive': True, 'since_iso': since_iso}
+    tui._log_stream = state
+    threading.Thread(target=_pump_log_stream, args=(state,), daemon=True).start()
+    return True
+
+def drain_log_stream(tui):
+    """Collect queued stream lines without blocking
+    
+    Returns (lines, last_timestamp, alive); once the stream has ended and its
+    queue is drained, it is dropped and alive is False.
+    """
+    state = getattr(tui, '_log_stream', None)
+    if state is None:
+        return [], None, False
+    
+    # Read alive first so every line queued before the stream ended is drained
+    alive = state['alive']
+    lines = []
+    last_iso = None
+    get_nowait = state['queue'].get_nowait
+    while True:
+        try:
+            ts, line = get_nowait()
+        except queue.Empty:
+            break
+        lines.append(line)
+        if ts:
+            last_iso = ts
+    
+    if not alive:
+        stop_log_stream(tui)
+    return lines, last_iso, alive
+
+def stop_log_stream(tui):
+    """Close the followed docker stream, which also ends its thread"""
+    state = getattr(tui, '_log_stream', None)
+    tui._log_stream = None
+    if state is not None:
+        try:
+            state['stream'].close()
+        except Exception:
+            pass
+
 def fetch_logs_with_time_filter(container, since=None, until=None, tail=None):
     """Fetch logs using Docker's native time filtering"""
     # Maximum number of logs to prevent memory issues and crashes
@@ -958,6 +1760,52 @@ def show_tail_dialog(stdscr, current_tail):
             if len(input_str) < 6:  # Limit to 6 digits
                 input_str += chr(ch)
     
+def read_prompt_text(stdscr, first_ch, timeout_ms=100):
+    """Collect a burst of printable input that starts with first_ch
+    
+    Pasted text arrives as many key codes at once; everything already queued
+    is consumed here so the prompt is redrawn once per burst rather than once
+    per character. Bytes are gathered in a bytearray and decoded once, so
+    multi-byte UTF-8 input is not mangled into Latin-1 characters. The first
+    non-printable key is pushed back for the caller, and the getch timeout is
+    restored to timeout_ms.
+    """
+    buf = bytearray((first_ch,))
+    stdscr.timeout(0)
+    try:
+        ch = stdscr.getch()
+        # 127 is Backspace on most terminals; leave it to the caller
+        while 32 <= ch < 256 and ch != 127:
+            buf.append(ch)
+            ch = stdscr.getch()
+    finally:
+        stdscr.timeout(timeout_ms)
+    if ch != -1:
+        curses.ungetch(ch)
+    return buf.decode('utf-8', 'replace')
+
+def paint_log_header(stdscr, w, header_text):
+    """Draw header_text centered on a blank row 0 in the header colors"""
+    # Each addstr passes its own attributes, so no attron/attroff pair is needed
+    safe_addstr(stdscr, 0, 0, " " * w)
+    safe_addstr(stdscr, 0, (w-len(header_text))//2, header_text, curses.color_pair(5) | curses.A_BOLD)
+
+def paint_prompt_row(stdscr, h, w, prompt, input_text, case_text):
+    """Draw the bottom prompt row: bold prompt, input padded to the case indicator
+
+    Returns the cursor column at the end of the input.
+    """
+    attr = curses.color_pair(6)
+    safe_addstr(stdscr, h-1, 0, prompt, attr | curses.A_BOLD)
+    safe_addstr(stdscr, h-1, len(prompt), input_text.ljust(w - len(prompt) - len(case_text) - 1), attr)
+    safe_addstr(stdscr, h-1, w - len(case_text) - 1, case_text, attr | curses.A_BOLD)
+    return len(prompt) + len(input_text)
+
+def paint_filter_help(stdscr, h, w):
+    """Draw the filter syntax hint centered above the prompt row, if it fits"""
+    if w > len(FILTER_HELP_TEXT) + 15:
+        safe_addstr(stdscr, h-2, (w - len(FILTER_HELP_TEXT)) // 2, FILTER_HELP_TEXT, curses.A_DIM)
+
 def show_logs(tui, stdscr, container):
     """Display container logs with follow mode and search"""
     try:
@@ -976,24 +1824,20 @@ def show_logs(tui, stdscr, container):
         # Initialize tail value (default 500)
         tail_lines = getattr(tui, 'log_tail_lines', 500)
         
-        # Fetch initial logs
-        if tail_lines == 0:
-            raw_logs = container.logs().decode(errors='ignore').splitlines()
-        else:
-            raw_logs = container.logs(tail=tail_lines).decode(errors='ignore').splitlines()
+        # Fetch initial logs, remembering where follow mode should resume
+        raw_logs, last_log_time_iso = fetch_container_logs(container, tail=tail_lines)
+        
+        # Follow new lines as docker emits them; polling is the fallback
+        log_streaming = start_log_stream(tui, container, last_log_time_iso)
         
         # Process logs through normalize_logs.py
-        logs = normalize_container_logs(tui.normalize_logs, tui.normalize_logs_script, raw_logs) if tui.normalize_logs else raw_logs
+        logs = normalize_container_logs(tui.normalize_logs, tui.normalize_logs_script, raw_logs, tui) if tui.normalize_logs else raw_logs
         
         # Set up follow mode
         follow_mode = True
         last_log_time = time.time()
         log_update_interval = 0.5  # seconds (faster updates)
         
-        # Track last log line to avoid duplicates
-        last_log_line = logs[-1] if logs else ""
-        last_log_count = len(logs)
-        
         # Create a pad for scrolling and get the metadata
         pad_info = rebuild_log_pad(logs, w, h, tui.wrap_log_lines)
         pad = pad_info['pad']
@@ -1005,7 +1849,7 @@ def show_logs(tui, stdscr, container):
         
         # Horizontal scroll
         h_scroll = 0
-        max_line_length = max([len(line) for line in logs], default=0)
+        max_line_length = pad_info['max_line_length']
         
         # Search state
         search_string = ""
@@ -1013,6 +1857,10 @@ def show_logs(tui, stdscr, container):
         search_mode = False
         search_matches = []
         current_match = -1
+        highlighted_pad_info = None  # Pad build whose painted highlights are tracked in highlighted_chunks
+        highlighted_chunks = set()  # HIGHLIGHT_CHUNK_ROWS blocks of that pad already painted
+        spare_pad = None  # Pad set aside by the last wrap toggle, see swap_log_pad
+        search_cache = {}  # Matches of recent searches per list, reused across pad rebuilds
         
         # Filter state
         filter_string = ""
@@ -1021,9 +1869,11 @@ def show_logs(tui, stdscr, container):
         # Initial state flags
         filtering_active = False
         filtered_logs = []
-        filtered_line_map = []  # Maps filtered index to original index
-        original_logs = logs.copy()  # Keep a copy of original logs
+        filtered_line_map = array.array('i')  # Maps filtered index to original index
+        original_logs = logs  # Unfiltered logs; shared, never mutated through logs
         case_sensitive = False
+        lower_cache = {}  # Lowercased shadow copies for case-insensitive search/filter
+        filter_cache = {}  # Last filter result, extended as follow mode appends
         
         # Time filter state
         time_filter_active = False
@@ -1037,9 +1887,10 @@ def show_logs(tui, stdscr, container):
         just_processed_search = False
         just_processed_filter = False
         
-        # Initial draw of screen
-        stdscr.refresh()
-        pad.refresh(pos, h_scroll, 2, 0, h-2, w-2)
+        # Initial draw of screen, staged and flushed in a single update
+        stdscr.noutrefresh()
+        pad.noutrefresh(pos, h_scroll, 2, 0, h-2, w-2)
+        curses.doupdate()
         
         # Reduce refresh rate to avoid flashing
         draw_interval = 0.3  # seconds between screen refreshes
@@ -1047,13 +1898,21 @@ def show_logs(tui, stdscr, container):
         # Main log viewing loop
         running = True
         last_display_time = 0
-        all_raw_logs = raw_logs.copy()  # Keep track of ALL raw logs for toggling
+        # Inputs the last draw tick rendered; None forces the next tick to repaint
+        last_draw_state = None
+        # Header text the draw tick last painted; None forces a repaint
+        header_on_screen = None
+        # (mode, input, case) of the search/filter prompt on the bottom row
+        prompt_on_screen = None
         
         # ADDED: Maximum logs to keep in memory
-        MAX_LOG_LINES = 25000  # Reduced to prevent memory issues and crashes
+        MAX_LOG_LINES = getattr(tui, 'log_max_lines', 25000)  # Reduced to prevent memory issues and crashes
         LOG_CLEANUP_INTERVAL = 100  # Clean up every 100 new lines
         new_lines_since_cleanup = 0
         
+        # Keep track of ALL raw logs for toggling; the ring buffer drops the oldest lines itself
+        all_raw_logs = deque(raw_logs, maxlen=MAX_LOG_LINES)
+        
         # Track logical lines for accurate navigation
         last_logical_lines_count = len(logs)
         
@@ -1066,27 +1925,10 @@ def show_logs(tui, stdscr, container):
         stdscr.clear()
         
         # Draw header
-        stdscr.attron(curses.color_pair(5))
-        safe_addstr(stdscr, 0, 0, " " * w)
-        normalized_indicator = " [NORMALIZED]" if tui.normalize_logs else " [RAW]"
-        wrap_indicator = " [WRAP]" if tui.wrap_log_lines else " [NOWRAP]"
-        search_indicator = f" [SEARCH: {search_string}]" if search_string else ""
-        filter_indicator = get_filter_indicator(filter_string) if filtering_active else ""
-        tail_indicator = f" [TAIL: {tail_lines if tail_lines > 0 else 'ALL'}]"
-        header_text = f" Logs: {container.name} " + (" [FOLLOW]" if follow_mode else " [STATIC]") + normalized_indicator + wrap_indicator + tail_indicator + search_indicator + filter_indicator
-        safe_addstr(stdscr, 0, (w-len(header_text))//2, header_text, curses.color_pair(5) | curses.A_BOLD)
-        stdscr.attroff(curses.color_pair(5))
+        paint_log_header(stdscr, w, render_header(container.name, follow_mode, tui.normalize_logs, tui.wrap_log_lines, tail_lines, search_string, filter_string if filtering_active else ""))
         
         # Draw footer with help
-        if filtering_active or time_filter_active:
-            if tui.wrap_log_lines:
-                footer_text = " ↑/↓:Scroll | F:Follow | R:Time | E:Export | /:Search | \\:Filter | ESC:Clear | Q:Back "
-            else:
-                footer_text = " ↑/↓:Scroll | ←/→:H-Scroll | F:Follow | R:Time | E:Export | /:Search | \\:Filter | ESC:Clear | Q:Back "
-        elif tui.wrap_log_lines:
-            footer_text = " ↑/↓:Scroll | PgUp/Dn | F:Follow | N:Normalize | W:Wrap | T:Tail | R:Time | E:Export | /:Search | \\:Filter | ESC:Back "
-        else:
-            footer_text = " ↑/↓:Scroll | ←/→:H-Scroll | PgUp/Dn | F:Follow | N:Normalize | W:Wrap | T:Tail | R:Time | E:Export | /:Search | \\:Filter | ESC:Back "
+        footer_text = LOG_VIEW_FOOTERS[(filtering_active or time_filter_active, tui.wrap_log_lines)]
         
         stdscr.attron(curses.color_pair(6))
         safe_addstr(stdscr, h-1, 0, footer_text + " " * (w - len(footer_text)), curses.color_pair(6))
@@ -1103,170 +1945,121 @@ def show_logs(tui, stdscr, container):
             
             current_time = time.time()
             
+            # View settings only change in the N/W key handlers below; read them once per pass
+            wrap_log_lines = tui.wrap_log_lines
+            normalize_logs = tui.normalize_logs
+            
             # Update logs in follow mode (but not when time filtering is active)
             if follow_mode and not time_filter_active and current_time - last_log_time >= log_update_interval:
                 try:
-                    # Use tail to get only new logs since we last checked
-                    # This approach avoids duplicates by only getting logs we haven't seen
-                    raw_new_logs = container.logs(
-                        tail=50,  # Reduced from 100 to minimize overlap
-                        stream=False
-                    ).decode(errors='ignore').splitlines()
+                    if log_streaming:
+                        # Take whatever the stream thread has queued since the last tick
+                        truly_new_logs, stream_iso, log_streaming = drain_log_stream(tui)
+                        if stream_iso:
+                            last_log_time_iso = stream_iso
+                    else:
+                        # Ask docker only for lines newer than the last one we have
+                        truly_new_logs, last_log_time_iso = fetch_container_logs(container, since_iso=last_log_time_iso)
                     
-                    if raw_new_logs:
-                        # Find where the new logs start (avoid duplicates)
-                        new_start_idx = 0
-                        if last_log_count > 0 and len(raw_new_logs) > last_log_count:
-                            # We have more logs than before, find the overlap
-                            for i in range(len(raw_new_logs) - last_log_count):
-                                if raw_new_logs[i:i+last_log_count] == all_raw_logs[-last_log_count:]:
-                                    new_start_idx = i + last_log_count
-                                    break
-                        elif last_log_line and raw_new_logs:
-                            # Find where the last log line appears in the new logs
-                            try:
-                                last_idx = raw_new_logs.index(last_log_line)
-                                new_start_idx = last_idx + 1
-                            except ValueError:
-                                # Last line not found, these must all be new
-                                new_start_idx = 0
+                    if truly_new_logs:
+                        # Update raw_logs with new content for toggling
+                        all_raw_logs.extend(truly_new_logs)
                         
-                        # Extract only truly new logs
-                        truly_new_logs = raw_new_logs[new_start_idx:] if new_start_idx < len(raw_new_logs) else []
+                        # Process new logs through normalize_logs.py if normalization is on
+                        new_logs = normalize_container_logs(normalize_logs, tui.normalize_logs_script, truly_new_logs, tui) if normalize_logs else truly_new_logs
                         
-                        if truly_new_logs:
-                            # Update tracking variables
-                            last_log_line = raw_new_logs[-1]
-                            last_log_count = min(50, len(raw_new_logs))  # Track up to 50 lines
-                            
-                            # Update raw_logs with new content for toggling
-                            all_raw_logs.extend(truly_new_logs)
-                            
-                            # Process new logs through normalize_logs.py if normalization is on
-                            new_logs = normalize_container_logs(tui.normalize_logs, tui.normalize_logs_script, truly_new_logs) if tui.normalize_logs else truly_new_logs
-                            
-                            # Add to original logs
-                            original_logs.extend(new_logs)
-                            
-                            # ADDED: Cleanup old logs if we exceed the limit
-                            new_lines_since_cleanup += len(truly_new_logs)
+                        # Add to original logs
+                        original_logs.extend(new_logs)
+                        
+                        # ADDED: Cleanup old logs if we exceed the limit
+                        new_lines_since_cleanup += len(truly_new_logs)
+                        pad_rebuilt = False  # Set when the trim below already drew new_logs
+                        
+                        if new_lines_since_cleanup >= LOG_CLEANUP_INTERVAL:
+                            new_lines_since_cleanup = 0
                             
-                            if new_lines_since_cleanup >= LOG_CLEANUP_INTERVAL:
-                                new_lines_since_cleanup = 0
+                            # Trim original_logs if too large
+                            if len(original_logs) > MAX_LOG_LINES:
+                                excess = len(original_logs) - MAX_LOG_LINES
+                                original_logs = original_logs[excess:]
                                 
-                                # Trim all_raw_logs if too large
-                                if len(all_raw_logs) > MAX_LOG_LINES:
-                                    excess = len(all_raw_logs) - MAX_LOG_LINES
-                                    all_raw_logs = all_raw_logs[excess:]
+                                # If filtering is active, reapply filters to trimmed logs
+                                if filtering_active or time_filter_active:
+                                    # Start with original logs
+                                    filtered_logs = original_logs
                                     
-                                # Trim original_logs if too large
-                                if len(original_logs) > MAX_LOG_LINES:
-                                    excess = len(original_logs) - MAX_LOG_LINES
-                                    original_logs = original_logs[excess:]
+                                    # Apply time filter first if active
+                                    if time_filter_active:
+                                        filtered_logs, _ = filter_logs_by_time(filtered_logs, time_filter_from, time_filter_to)
                                     
-                                    # If filtering is active, reapply filters to trimmed logs
-                                    if filtering_active or time_filter_active:
-                                        # Start with original logs
-                                        filtered_logs = original_logs
-                                        
-                                        # Apply time filter first if active
-                                        if time_filter_active:
-                                            filtered_logs, _ = filter_logs_by_time(filtered_logs, time_filter_from, time_filter_to)
-                                        
-                                        # Then apply text filter if active
-                                        if filtering_active:
-                                            filtered_logs, filtered_line_map = filter_logs(filtered_logs, filter_string, case_sensitive)
-                                        
-                                        logs = filtered_logs
-                                    else:
-                                        logs = original_logs
-                                        
-                                    # Rebuild pad with trimmed logs
-                                    pad_info = rebuild_log_pad(logs, w, h, tui.wrap_log_lines)
-                                    pad = pad_info['pad']
-                                    line_positions = pad_info['line_positions']
-                                    actual_lines_count = pad_info['actual_lines']
+                                    # Then apply text filter if active
+                                    if filtering_active:
+                                        filtered_logs, filtered_line_map = filter_logs(filtered_logs, filter_string, case_sensitive, lower_cache=lower_cache, filter_cache=filter_cache)
                                     
-                                    # Adjust position if needed
-                                    if pos > actual_lines_count - (h-4):
-                                        pos = max(0, actual_lines_count - (h-4))
-                            
-                            # If filtering is active, apply filters to new logs
-                            if filtering_active or time_filter_active:
-                                # Start with original logs
-                                filtered_logs = original_logs
-                                
-                                # Apply time filter first if active
-                                if time_filter_active:
-                                    filtered_logs, _ = filter_logs_by_time(filtered_logs, time_filter_from, time_filter_to)
-                                
-                                # Then apply text filter if active
-                                if filtering_active:
-                                    filtered_logs, filtered_line_map = filter_logs(filtered_logs, filter_string, case_sensitive)
-                                
-                                logs = filtered_logs
-                                
-                                # Rebuild pad with filtered logs
-                                pad_info = rebuild_log_pad(logs, w, h, tui.wrap_log_lines)
+                                    logs = filtered_logs
+                                else:
+                                    logs = original_logs
+                                    
+                                # Rebuild pad with trimmed logs
+                                pad_info = rebuild_log_pad(logs, w, h, wrap_log_lines, pad_info)
+                                pad_rebuilt = True
                                 pad = pad_info['pad']
                                 line_positions = pad_info['line_positions']
                                 actual_lines_count = pad_info['actual_lines']
-                            else:
-                                # Add to current logs
-                                logs.extend(new_logs)
                                 
-                                # Check if we need to resize the pad
-                                new_lines_estimate = len(new_logs)
-                                if tui.wrap_log_lines:
-                                    # Estimate additional space needed for wrapping
-                                    new_lines_estimate += sum(max(1, len(line) // (w-3)) for line in new_logs)
-                                    
-                                if actual_lines_count + new_lines_estimate >= pad.getmaxyx()[0]:
-                                    # Need a new pad - rebuild with all logs
-                                    pad_info = rebuild_log_pad(logs, w, h, tui.wrap_log_lines)
-                                    pad = pad_info['pad']
-                                    line_positions = pad_info['line_positions']
-                                    actual_lines_count = pad_info['actual_lines']
-                                else:
-                                    # Append new logs to existing pad
-                                    current_line = actual_lines_count
-                                    for i, line in enumerate(new_logs):
-                                        line_positions.append(current_line)
-                                        if tui.wrap_log_lines:
-                                            # Split the line into wrapped segments
-                                            remaining = line
-                                            while remaining:
-                                                segment = remaining[:w-3]
-                                                try:
-                                                    pad.addstr(current_line, 0, segment)
-                                                except curses.error:
-                                                    pass
-                                                current_line += 1
-                                                remaining = remaining[w-3:]
-                                        else:
-                                            # No wrapping - just add the whole line
-                                            try:
-                                                pad.addstr(current_line, 0, line)
-                                            except curses.error:
-                                                pass
-                                            current_line += 1
-                                    
-                                    # Update line counts
-                                    actual_lines_count = current_line
+                                # Adjust position if needed
+                                if pos > actual_lines_count - (h-4):
+                                    pos = max(0, actual_lines_count - (h-4))
+                        
+                        # If filtering is active, apply filters to new logs
+                        if filtering_active or time_filter_active:
+                            shown_count = len(logs)
                             
-                            # Update line count
-                            last_logical_lines_count = len(logs)
+                            # Start with original logs
+                            filtered_logs = original_logs
                             
-                            # Reapply search highlights if we have a search pattern
-                            if search_string:
-                                search_result = search_and_highlight(pad, logs, search_string, line_positions, w, case_sensitive, pos)
-                                search_matches = search_result['matches']
-                                current_match = search_result['current_match']
-                                highlight_search_matches(pad, line_positions, tui.wrap_log_lines, w, search_matches, current_match)
+                            # Apply time filter first if active
+                            if time_filter_active:
+                                filtered_logs, _ = filter_logs_by_time(filtered_logs, time_filter_from, time_filter_to)
                             
-                            # Auto-scroll to bottom in follow mode
-                            if follow_mode:
-                                pos = max(0, actual_lines_count - (h-4))
+                            # Then apply text filter if active
+                            if filtering_active:
+                                filtered_logs, filtered_line_map = filter_logs(filtered_logs, filter_string, case_sensitive, lower_cache=lower_cache, filter_cache=filter_cache)
+                            
+                            if filtered_logs is logs:
+                                # filter_cache only scanned the new lines and extended the
+                                # list already on screen, so draw just the lines that passed
+                                append_to_pad(pad_info, logs[shown_count:], wrap_log_lines, w)
+                            else:
+                                logs = filtered_logs
+                                
+                                # Rebuild pad with filtered logs
+                                pad_info = rebuild_log_pad(logs, w, h, wrap_log_lines, pad_info)
+                                pad = pad_info['pad']
+                                line_positions = pad_info['line_positions']
+                            actual_lines_count = pad_info['actual_lines']
+                        else:
+                            # Unfiltered view shows original logs, which already has the new lines
+                            logs = original_logs
+                            
+                            # Draw only the new lines; the pad grows in place when full
+                            if not pad_rebuilt:
+                                append_to_pad(pad_info, new_logs, wrap_log_lines, w)
+                            actual_lines_count = pad_info['actual_lines']
+                        
+                        # Update line count
+                        last_logical_lines_count = len(logs)
+                        
+                        # Reapply search highlights if we have a search pattern
+                        if search_string:
+                            search_result = search_and_highlight(pad, logs, search_string, line_positions, w, case_sensitive, pos, lower_cache, search_cache)
+                            search_matches = search_result['matches']
+                            current_match = search_result['current_match']
+                            highlighted_pad_info = None  # Visible highlights are repainted on the next frame
+                        
+                        # Auto-scroll to bottom in follow mode
+                        if follow_mode:
+                            pos = max(0, actual_lines_count - (h-4))
                 except Exception:
                     pass  # Ignore errors in log fetching
                 
@@ -1279,33 +2072,36 @@ def show_logs(tui, stdscr, container):
                 pos = 0
             
             # Handle search input mode
+            # Everything the idle draw tick depends on, compared against the last painted frame
+            draw_state = (pos, h_scroll, len(logs), follow_mode, search_string, filter_string, current_match)
+            
             if search_mode:
-                # Create input line at bottom
-                search_prompt = " Search: "
-                stdscr.attron(curses.color_pair(6))
-                safe_addstr(stdscr, h-1, 0, search_prompt, curses.color_pair(6) | curses.A_BOLD)
-                safe_addstr(stdscr, h-1, len(search_prompt), search_input + " " * (w - len(search_prompt) - len(search_input) - 1), curses.color_pair(6))
-                
-                # Show case sensitivity indicator
-                case_text = "Case: " + ("ON" if case_sensitive else "OFF") + " (Tab)"
-                safe_addstr(stdscr, h-1, w - len(case_text) - 1, case_text, curses.color_pair(6) | curses.A_BOLD)
-                
-                # Show search status if there's a current search
-                if search_string and search_matches:
-                    match_info = f" {current_match + 1}/{len(search_matches)} matches "
-                    safe_addstr(stdscr, 1, 0, match_info, curses.A_BOLD)
-                
-                stdscr.attroff(curses.color_pair(6))
-                
-                # Show cursor at end of input
-                curses.curs_set(1)  # Show cursor
-                stdscr.move(h-1, len(search_prompt) + len(search_input))
-                stdscr.refresh()
+                # Redraw the prompt only when its input, case flag, match counter or screen size changed
+                if prompt_on_screen != ('search', search_input, case_sensitive, current_match, h, w):
+                    prompt_on_screen = ('search', search_input, case_sensitive, current_match, h, w)
+                    
+                    # Create input line at bottom, with the case sensitivity indicator
+                    cursor_x = paint_prompt_row(stdscr, h, w, SEARCH_PROMPT, search_input, SEARCH_CASE_TEXT[case_sensitive])
+                    
+                    # Show search status if there's a current search
+                    if search_string and search_matches:
+                        match_info = f" {current_match + 1}/{len(search_matches)} matches "
+                        safe_addstr(stdscr, 1, 0, match_info, curses.A_BOLD)
+                    
+                    # Show cursor at end of input
+                    curses.curs_set(1)  # Show cursor
+                    stdscr.move(h-1, cursor_x)
+                    stdscr.refresh()
                 
                 # Get character
                 ch = stdscr.getch()
+                last_draw_state = None
+                header_on_screen = None
                 
-                if ch == 27:  # Escape - exit search mode
+                if ch == curses.KEY_RESIZE:
+                    # The terminal wiped the screen; paint the prompt again
+                    prompt_on_screen = None
+                elif ch == 27:  # Escape - exit search mode
                     search_mode = False
                     curses.curs_set(0)  # Hide cursor
                     just_processed_search = True  # Skip normal key handling this iteration
@@ -1317,65 +2113,49 @@ def show_logs(tui, stdscr, container):
                         search_string = search_input
                         
                         # Perform search
-                        search_result = search_and_highlight(pad, logs, search_string, line_positions, w, case_sensitive, pos)
+                        search_result = search_and_highlight(pad, logs, search_string, line_positions, w, case_sensitive, pos, lower_cache, search_cache)
                         search_matches = search_result['matches']
                         current_match = search_result['current_match']
                         
                         # Update UI if search was successful
                         if search_matches:
                             # Jump to first match
-                            next_match = next_search_match(search_matches, current_match - 1, line_positions, tui.wrap_log_lines, w)
+                            next_match = next_search_match(search_matches, current_match - 1, line_positions, wrap_log_lines, w)
                             if next_match:
                                 pos = next_match['position']
                                 current_match = next_match['match_index']
                             follow_mode = False  # Disable follow mode when searching
                             
                             # Apply highlights
-                            highlight_search_matches(pad, line_positions, tui.wrap_log_lines, w, search_matches, current_match)
+                            highlighted_pad_info = pad_info
+                            highlighted_chunks = set()
+                            pad_info['highlighted'] = True
+                            highlight_visible_matches(pad, line_positions, wrap_log_lines, w, search_matches, current_match, highlighted_chunks, pos, pos + h - 4)
                             
                             # Exit search mode but keep the string
                             search_mode = False
                             curses.curs_set(0)  # Hide cursor
                             
                             # Clear input buffer completely to prevent Enter key from being processed again
-                            stdscr.nodelay(True)
-                            while stdscr.getch() != -1:
-                                pass  # Discard any input
-                            stdscr.nodelay(False)
+                            curses.flushinp()
                             
-                            # Force refresh
-                            stdscr.clear()
+                            # Blank the window in memory only; the repaint below sends just the changes
+                            stdscr.erase()
                             
                             # Update header with search info
-                            stdscr.attron(curses.color_pair(5))
-                            safe_addstr(stdscr, 0, 0, " " * w)
-                            normalized_indicator = " [NORMALIZED]" if tui.normalize_logs else " [RAW]"
-                            wrap_indicator = " [WRAP]" if tui.wrap_log_lines else " [NOWRAP]"
-                            search_indicator = f" [SEARCH: {search_string}]"
-                            filter_indicator = get_filter_indicator(filter_string) if filtering_active else ""
-                            tail_indicator = f" [TAIL: {tail_lines if tail_lines > 0 else 'ALL'}]"
-                            header_text = f" Logs: {container.name} " + (" [FOLLOW]" if follow_mode else " [STATIC]") + normalized_indicator + wrap_indicator + tail_indicator + search_indicator + filter_indicator
-                            safe_addstr(stdscr, 0, (w-len(header_text))//2, header_text, curses.color_pair(5) | curses.A_BOLD)
-                            stdscr.attroff(curses.color_pair(5))
+                            paint_log_header(stdscr, w, render_header(container.name, follow_mode, normalize_logs, wrap_log_lines, tail_lines, search_string, filter_string if filtering_active else ""))
                             
                             # Restore normal footer
-                            if filtering_active or time_filter_active:
-                                if tui.wrap_log_lines:
-                                    footer_text = " ↑/↓:Scroll | F:Follow | R:Time | E:Export | /:Search | \\:Filter | ESC:Clear | Q:Back "
-                                else:
-                                    footer_text = " ↑/↓:Scroll | ←/→:H-Scroll | F:Follow | R:Time | E:Export | /:Search | \\:Filter | ESC:Clear | Q:Back "
-                            elif tui.wrap_log_lines:
-                                footer_text = " ↑/↓:Scroll | PgUp/Dn | F:Follow | N:Normalize | W:Wrap | T:Tail | R:Time | E:Export | /:Search | \\:Filter | ESC:Back "
-                            else:
-                                footer_text = " ↑/↓:Scroll | ←/→:H-Scroll | PgUp/Dn | F:Follow | N:Normalize | W:Wrap | T:Tail | R:Time | E:Export | /:Search | \\:Filter | ESC:Back "
+                            footer_text = LOG_VIEW_FOOTERS[(filtering_active or time_filter_active, wrap_log_lines)]
                             
                             stdscr.attron(curses.color_pair(6))
                             safe_addstr(stdscr, h-1, 0, footer_text + " " * (w - len(footer_text)), curses.color_pair(6))
                             stdscr.attroff(curses.color_pair(6))
                             
-                            # Force an immediate pad refresh
-                            pad.refresh(pos, h_scroll, 2, 0, h-2, w-2)
-                            stdscr.refresh()
+                            # Repaint header, footer and pad in a single terminal update
+                            stdscr.noutrefresh()
+                            pad.noutrefresh(pos, h_scroll, 2, 0, h-2, w-2)
+                            curses.doupdate()
                             
                             # Skip normal key handling in this iteration
                             just_processed_search = True
@@ -1386,10 +2166,7 @@ def show_logs(tui, stdscr, container):
                             time.sleep(1)  # Show message briefly
                             
                             # Clear any remaining input in the buffer
-                            stdscr.nodelay(True)
-                            while stdscr.getch() != -1:
-                                pass
-                            stdscr.nodelay(False)
+                            curses.flushinp()
                     else:
                         # Empty search string - clear search
                         search_string = ""
@@ -1399,58 +2176,54 @@ def show_logs(tui, stdscr, container):
                         curses.curs_set(0)  # Hide cursor
                         
                         # Clear any remaining input in the buffer
-                        stdscr.nodelay(True)
-                        while stdscr.getch() != -1:
-                            pass
-                        stdscr.nodelay(False)
+                        curses.flushinp()
                         
                         just_processed_search = True  # Skip normal key handling this iteration
                 elif ch == 9:  # Tab - toggle case sensitivity
                     case_sensitive = not case_sensitive
                 elif ch == 14:  # Ctrl+N - next match
                     if search_string and search_matches:
-                        next_match = next_search_match(search_matches, current_match, line_positions, tui.wrap_log_lines, w)
+                        next_match = next_search_match(search_matches, current_match, line_positions, wrap_log_lines, w)
                         if next_match:
                             pos = next_match['position']
+                            move_current_match(pad, line_positions, wrap_log_lines, w, search_matches, current_match, next_match['match_index'])
                             current_match = next_match['match_index']
                         follow_mode = False
                 elif ch == 16:  # Ctrl+P - previous match
                     if search_string and search_matches:
-                        prev_match = prev_search_match(search_matches, current_match, line_positions, tui.wrap_log_lines, w)
+                        prev_match = prev_search_match(search_matches, current_match, line_positions, wrap_log_lines, w)
                         if prev_match:
                             pos = prev_match['position']
+                            move_current_match(pad, line_positions, wrap_log_lines, w, search_matches, current_match, prev_match['match_index'])
                             current_match = prev_match['match_index']
                         follow_mode = False
-                elif ch < 256 and ch >= 32:  # Printable character
-                    search_input += chr(ch)
+                elif ch < 256 and ch >= 32:  # Printable character (or the start of a paste)
+                    search_input += read_prompt_text(stdscr, ch)
             
             # Handle filter input mode
             elif filter_mode:
-                # Create input line at bottom
-                filter_prompt = " Filter: "
-                stdscr.attron(curses.color_pair(6))
-                safe_addstr(stdscr, h-1, 0, filter_prompt, curses.color_pair(6) | curses.A_BOLD)
-                safe_addstr(stdscr, h-1, len(filter_prompt), filter_input + " " * (w - len(filter_prompt) - len(filter_input) - 1), curses.color_pair(6))
-                
-                # Show filter help
-                help_text = "Syntax: term AND/OR term, (term OR term), +include -exclude \"multi word\" | Tab:Case"
-                if w > len(help_text) + 15:
-                    safe_addstr(stdscr, h-2, (w - len(help_text)) // 2, help_text, curses.A_DIM)
-                
-                # Show case sensitivity indicator
-                case_text = "Case: " + ("ON" if case_sensitive else "OFF")
-                safe_addstr(stdscr, h-1, w - len(case_text) - 1, case_text, curses.color_pair(6) | curses.A_BOLD)
-                stdscr.attroff(curses.color_pair(6))
-                
-                # Show cursor at end of input
-                curses.curs_set(1)  # Show cursor
-                stdscr.move(h-1, len(filter_prompt) + len(filter_input))
-                stdscr.refresh()
+                # Redraw the prompt only when its input, case flag or screen size changed
+                if prompt_on_screen != ('filter', filter_input, case_sensitive, h, w):
+                    prompt_on_screen = ('filter', filter_input, case_sensitive, h, w)
+                    
+                    # Create input line at bottom, with the case sensitivity indicator
+                    cursor_x = paint_prompt_row(stdscr, h, w, FILTER_PROMPT, filter_input, FILTER_CASE_TEXT[case_sensitive])
+                    paint_filter_help(stdscr, h, w)
+                    
+                    # Show cursor at end of input
+                    curses.curs_set(1)  # Show cursor
+                    stdscr.move(h-1, cursor_x)
+                    stdscr.refresh()
                 
                 # Get character
                 ch = stdscr.getch()
+                last_draw_state = None
+                header_on_screen = None
                 
-                if ch == 27:  # Escape - exit filter mode
+                if ch == curses.KEY_RESIZE:
+                    # The terminal wiped the screen; paint the prompt again
+                    prompt_on_screen = None
+                elif ch == 27:  # Escape - exit filter mode
                     filter_mode = False
                     curses.curs_set(0)  # Hide cursor
                     just_processed_filter = True  # Skip normal key handling this iteration
@@ -1463,14 +2236,14 @@ def show_logs(tui, stdscr, container):
                         filter_string = filter_input
                         
                         # Apply filter to logs
-                        filtered_logs, filtered_line_map = filter_logs(original_logs, filter_string, case_sensitive)
+                        filtered_logs, filtered_line_map = filter_logs(original_logs, filter_string, case_sensitive, lower_cache=lower_cache, filter_cache=filter_cache)
                         
                         # Apply filter regardless of whether there are matches
                         filtering_active = True
                         logs = filtered_logs
                         
                         # Rebuild pad with filtered logs
-                        pad_info = rebuild_log_pad(logs, w, h, tui.wrap_log_lines)
+                        pad_info = rebuild_log_pad(logs, w, h, wrap_log_lines, pad_info)
                         pad = pad_info['pad']
                         line_positions = pad_info['line_positions']
                         actual_lines_count = pad_info['actual_lines']
@@ -1480,32 +2253,20 @@ def show_logs(tui, stdscr, container):
                         
                         # Apply search highlighting if there's a search pattern
                         if search_string:
-                            search_result = search_and_highlight(pad, logs, search_string, line_positions, w, case_sensitive, pos)
+                            search_result = search_and_highlight(pad, logs, search_string, line_positions, w, case_sensitive, pos, lower_cache, search_cache)
                             search_matches = search_result['matches']
                             current_match = search_result['current_match']
-                            highlight_search_matches(pad, line_positions, tui.wrap_log_lines, w, search_matches, current_match)
+                            highlighted_pad_info = None  # Visible highlights are repainted on the next frame
                         
                         # Exit filter mode
                         filter_mode = False
                         curses.curs_set(0)  # Hide cursor
                         
                         # Clear input buffer
-                        stdscr.nodelay(True)
-                        while stdscr.getch() != -1:
-                            pass
-                        stdscr.nodelay(False)
+                        curses.flushinp()
                         
                         # Update header with filter info
-                        stdscr.attron(curses.color_pair(5))
-                        safe_addstr(stdscr, 0, 0, " " * w)
-                        normalized_indicator = " [NORMALIZED]" if tui.normalize_logs else " [RAW]"
-                        wrap_indicator = " [WRAP]" if tui.wrap_log_lines else " [NOWRAP]"
-                        search_indicator = f" [SEARCH: {search_string}]" if search_string else ""
-                        filter_indicator = get_filter_indicator(filter_string)
-                        tail_indicator = f" [TAIL: {tail_lines if tail_lines > 0 else 'ALL'}]"
-                        header_text = f" Logs: {container.name} " + (" [FOLLOW]" if follow_mode else " [STATIC]") + normalized_indicator + wrap_indicator + tail_indicator + search_indicator + filter_indicator
-                        safe_addstr(stdscr, 0, (w-len(header_text))//2, header_text, curses.color_pair(5) | curses.A_BOLD)
-                        stdscr.attroff(curses.color_pair(5))
+                        paint_log_header(stdscr, w, render_header(container.name, follow_mode, normalize_logs, wrap_log_lines, tail_lines, search_string, filter_string))
                         
                         # Update filter info in status line
                         filter_info = f" Filtered: {len(filtered_logs)}/{len(original_logs)} lines "
@@ -1523,7 +2284,7 @@ def show_logs(tui, stdscr, container):
                             logs = original_logs
                             
                             # Rebuild pad with all logs
-                            pad_info = rebuild_log_pad(logs, w, h, tui.wrap_log_lines)
+                            pad_info = rebuild_log_pad(logs, w, h, wrap_log_lines, pad_info)
                             pad = pad_info['pad']
                             line_positions = pad_info['line_positions']
                             actual_lines_count = pad_info['actual_lines']
@@ -1533,21 +2294,13 @@ def show_logs(tui, stdscr, container):
                             
                             # Apply search highlighting if there's a search pattern
                             if search_string:
-                                search_result = search_and_highlight(pad, logs, search_string, line_positions, w, case_sensitive, pos)
+                                search_result = search_and_highlight(pad, logs, search_string, line_positions, w, case_sensitive, pos, lower_cache, search_cache)
                                 search_matches = search_result['matches']
                                 current_match = search_result['current_match']
-                                highlight_search_matches(pad, line_positions, tui.wrap_log_lines, w, search_matches, current_match)
+                                highlighted_pad_info = None  # Visible highlights are repainted on the next frame
                             
                             # Update header without filter info
-                            stdscr.attron(curses.color_pair(5))
-                            safe_addstr(stdscr, 0, 0, " " * w)
-                            normalized_indicator = " [NORMALIZED]" if tui.normalize_logs else " [RAW]"
-                            wrap_indicator = " [WRAP]" if tui.wrap_log_lines else " [NOWRAP]"
-                            search_indicator = f" [SEARCH: {search_string}]" if search_string else ""
-                            tail_indicator = f" [TAIL: {tail_lines if tail_lines > 0 else 'ALL'}]"
-                            header_text = f" Logs: {container.name} " + (" [FOLLOW]" if follow_mode else " [STATIC]") + normalized_indicator + wrap_indicator + tail_indicator + search_indicator
-                            safe_addstr(stdscr, 0, (w-len(header_text))//2, header_text, curses.color_pair(5) | curses.A_BOLD)
-                            stdscr.attroff(curses.color_pair(5))
+                            paint_log_header(stdscr, w, render_header(container.name, follow_mode, normalize_logs, wrap_log_lines, tail_lines, search_string, ""))
                             
                             # Clear filter info
                             safe_addstr(stdscr, 1, 0, " " * 30)
@@ -1562,38 +2315,27 @@ def show_logs(tui, stdscr, container):
                         curses.curs_set(0)  # Hide cursor
                         
                         # Clear input buffer
-                        stdscr.nodelay(True)
-                        while stdscr.getch() != -1:
-                            pass
-                        stdscr.nodelay(False)
+                        curses.flushinp()
                         
                         just_processed_filter = True
                 elif ch == 9:  # Tab - toggle case sensitivity
                     case_sensitive = not case_sensitive
-                elif ch < 256 and ch >= 32:  # Printable character
-                    filter_input += chr(ch)
+                elif ch < 256 and ch >= 32:  # Printable character (or the start of a paste)
+                    filter_input += read_prompt_text(stdscr, ch)
             
             # Update display regularly regardless of new logs or position changes
-            elif current_time - last_display_time >= draw_interval:  # Use the specified draw interval
-                # Update header only when needed (status change)
-                if follow_mode != last_follow_mode or tui.normalize_logs != last_normalize_logs or tui.wrap_log_lines != last_wrap_lines or (filtering_active and not logs):
-                    stdscr.attron(curses.color_pair(5))
-                    safe_addstr(stdscr, 0, 0, " " * w)
-                    normalized_indicator = " [NORMALIZED]" if tui.normalize_logs else " [RAW]"
-                    wrap_indicator = " [WRAP]" if tui.wrap_log_lines else " [NOWRAP]"
-                    search_indicator = f" [SEARCH: {search_string}]" if search_string else ""
-                    filter_indicator = f" [FILTER: {filter_string}]" if filtering_active else ""
-                    tail_indicator = f" [TAIL: {tail_lines if tail_lines > 0 else 'ALL'}]"
-                    header_text = f" Logs: {container.name} " + (" [FOLLOW]" if follow_mode else " [STATIC]") + normalized_indicator + wrap_indicator + tail_indicator + search_indicator + filter_indicator
-                    safe_addstr(stdscr, 0, (w-len(header_text))//2, header_text, curses.color_pair(5) | curses.A_BOLD)
-                    stdscr.attroff(curses.color_pair(5))
-                    
+            elif current_time - last_display_time >= draw_interval and (follow_mode or draw_state != last_draw_state):  # Skip idle ticks where nothing changed
+                # Repaint the header only when its text differs from what row 0 shows
+                header_text = render_header(container.name, follow_mode, normalize_logs, wrap_log_lines, tail_lines, search_string, filter_string if filtering_active else "")
+                if header_text != header_on_screen:
+                    paint_log_header(stdscr, w, header_text)
+                    header_on_screen = header_text
+                
+                # Update footer only when needed (status change)
+                if follow_mode != last_follow_mode or normalize_logs != last_normalize_logs or wrap_log_lines != last_wrap_lines or (filtering_active and not logs):
                     # Update footer if filtering is active
                     if filtering_active or time_filter_active:
-                        if tui.wrap_log_lines:
-                            footer_text = " ↑/↓:Scroll | F:Follow | R:Time | E:Export | /:Search | \\:Filter | ESC:Clear | Q:Back "
-                        else:
-                            footer_text = " ↑/↓:Scroll | ←/→:H-Scroll | F:Follow | R:Time | E:Export | /:Search | \\:Filter | ESC:Clear | Q:Back "
+                        footer_text = LOG_VIEW_FOOTERS[(True, wrap_log_lines)]
                         
                         stdscr.attron(curses.color_pair(6))
                         safe_addstr(stdscr, h-1, 0, footer_text + " " * (w - len(footer_text)), curses.color_pair(6))
@@ -1601,16 +2343,12 @@ def show_logs(tui, stdscr, container):
                     
                     # Track current state
                     last_follow_mode = follow_mode
-                    last_normalize_logs = tui.normalize_logs
-                    last_wrap_lines = tui.wrap_log_lines
+                    last_normalize_logs = normalize_logs
+                    last_wrap_lines = wrap_log_lines
                 
                 # Update line counter
                 if line_positions:
-                    logical_pos = 0
-                    for i, line_pos in enumerate(line_positions):
-                        if line_pos > pos:
-                            break
-                        logical_pos = i
+                    logical_pos = logical_line_at(line_positions, pos)
                     
                     line_info = f" Line: {logical_pos+1}/{last_logical_lines_count} "
                     safe_addstr(stdscr, 1, w-len(line_info)-1, line_info)
@@ -1636,16 +2374,18 @@ def show_logs(tui, stdscr, container):
                     scrollbar_pos = 2
                     if actual_lines_count > scrollbar_height:
                         scrollbar_pos = 2 + int((pos / (actual_lines_count - scrollbar_height)) * (scrollbar_height - 1))
-                    for i in range(2, h-2):
-                        if i == scrollbar_pos:
-                            safe_addstr(stdscr, i, w-1, "█")
-                        else:
-                            safe_addstr(stdscr, i, w-1, "│")
+                    # Draw the track in one call, then the thumb over it
+                    try:
+                        stdscr.vline(2, w-1, curses.ACS_VLINE, scrollbar_height)
+                    except curses.error:
+                        pass
+                    if 2 <= scrollbar_pos < h-2:
+                        safe_addstr(stdscr, scrollbar_pos, w-1, "█")
                 
                 # Determine horizontal scroll position
-                if not tui.wrap_log_lines:
-                    # Update max line length
-                    max_line_length = max([len(line) for line in logs], default=0)
+                if not wrap_log_lines:
+                    # Widest line, kept up to date by rebuild_log_pad/append_to_pad
+                    max_line_length = pad_info['max_line_length']
                     
                     # Show horizontal scrollbar if needed
                     if max_line_length > w-3:
@@ -1675,9 +2415,13 @@ def show_logs(tui, stdscr, container):
                         safe_addstr(stdscr, h-2, 0, h_scrollbar, curses.A_DIM)
                         safe_addstr(stdscr, h-2, w-len(pos_text), pos_text, curses.A_DIM)
                 
-                # Apply search highlights if needed
+                # Paint highlights for the rows on screen; navigation recolors incrementally
                 if search_string and search_matches:
-                    highlight_search_matches(pad, line_positions, tui.wrap_log_lines, w, search_matches, current_match)
+                    if highlighted_pad_info is not pad_info:
+                        highlighted_pad_info = pad_info
+                        highlighted_chunks = set()
+                        pad_info['highlighted'] = True
+                    highlight_visible_matches(pad, line_positions, wrap_log_lines, w, search_matches, current_match, highlighted_chunks, pos, pos + h - 4)
                 
                 # Display empty state message if filtering and no logs
                 if filtering_active and not logs:
@@ -1699,15 +2443,17 @@ def show_logs(tui, stdscr, container):
                     
                     stdscr.refresh()
                 else:
-                    # Always refresh the pad
+                    # Stage the frame and the pad, then push both to the terminal at once
                     try:
-                        pad.refresh(pos, h_scroll, 2, 0, h-2, w-2)
-                        stdscr.refresh()
+                        stdscr.noutrefresh()
+                        pad.noutrefresh(pos, h_scroll, 2, 0, h-2, w-2)
+                        curses.doupdate()
                     except curses.error:
                         # Handle potential pad errors
                         pass
                 
                 last_display_time = current_time
+                last_draw_state = draw_state
             
             # Handle key input in normal mode (but skip if we just processed a search/filter)
             if not search_mode and not filter_mode and not skip_normal_input:
@@ -1716,6 +2462,10 @@ def show_logs(tui, stdscr, container):
                 ch = stdscr.getch()
                 
                 if ch != -1:
+                    # Key handlers may draw over or clear the screen, so repaint on the next tick
+                    last_draw_state = None
+                    header_on_screen = None
+                    prompt_on_screen = None
                     if ch == curses.KEY_DOWN:
                         # Scroll down one line
                         if pos < actual_lines_count - 1:
@@ -1755,29 +2505,17 @@ def show_logs(tui, stdscr, container):
                             pos = max(0, actual_lines_count - (h-4))
                         
                         # Update header
-                        stdscr.attron(curses.color_pair(5))
-                        safe_addstr(stdscr, 0, 0, " " * w)
-                        normalized_indicator = " [NORMALIZED]" if tui.normalize_logs else " [RAW]"
-                        wrap_indicator = " [WRAP]" if tui.wrap_log_lines else " [NOWRAP]"
-                        search_indicator = f" [SEARCH: {search_string}]" if search_string else ""
-                        filter_indicator = get_filter_indicator(filter_string) if filtering_active else ""
-                        tail_indicator = f" [TAIL: {tail_lines if tail_lines > 0 else 'ALL'}]"
-                        header_text = f" Logs: {container.name} " + (" [FOLLOW]" if follow_mode else " [STATIC]") + normalized_indicator + wrap_indicator + tail_indicator + search_indicator + filter_indicator
-                        safe_addstr(stdscr, 0, (w-len(header_text))//2, header_text, curses.color_pair(5) | curses.A_BOLD)
-                        stdscr.attroff(curses.color_pair(5))
+                        paint_log_header(stdscr, w, render_header(container.name, follow_mode, tui.normalize_logs, tui.wrap_log_lines, tail_lines, search_string, filter_string if filtering_active else ""))
                         
                         # Update footer based on filter state
                         if filtering_active or time_filter_active:
-                            if tui.wrap_log_lines:
-                                footer_text = " ↑/↓:Scroll | F:Follow | R:Time | E:Export | /:Search | \\:Filter | ESC:Clear | Q:Back "
-                            else:
-                                footer_text = " ↑/↓:Scroll | ←/→:H-Scroll | F:Follow | R:Time | E:Export | /:Search | \\:Filter | ESC:Clear | Q:Back "
+                            footer_text = LOG_VIEW_FOOTERS[(True, tui.wrap_log_lines)]
                             
                             stdscr.attron(curses.color_pair(6))
                             safe_addstr(stdscr, h-1, 0, footer_text + " " * (w - len(footer_text)), curses.color_pair(6))
                             stdscr.attroff(curses.color_pair(6))
                         
-                        stdscr.refresh()
+                        last_display_time = 0  # The next draw tick flushes this with the pad in one update
                     elif ch in (ord('t'), ord('T')):  # Change tail lines
                         new_tail = show_tail_dialog(stdscr, tail_lines)
                         if new_tail != tail_lines:
@@ -1790,15 +2528,13 @@ def show_logs(tui, stdscr, container):
                             stdscr.refresh()
                             
                             # Fetch logs with new tail value
-                            if tail_lines == 0:
-                                raw_logs = container.logs().decode(errors='ignore').splitlines()
-                            else:
-                                raw_logs = container.logs(tail=tail_lines).decode(errors='ignore').splitlines()
+                            raw_logs, last_log_time_iso = fetch_container_logs(container, tail=tail_lines)
+                            log_streaming = start_log_stream(tui, container, last_log_time_iso)
                             
                             # Reset everything
-                            all_raw_logs = raw_logs.copy()
-                            logs = normalize_container_logs(tui.normalize_logs, tui.normalize_logs_script, raw_logs) if tui.normalize_logs else raw_logs
-                            original_logs = logs.copy()
+                            all_raw_logs = deque(raw_logs, maxlen=MAX_LOG_LINES)
+                            logs = normalize_container_logs(tui.normalize_logs, tui.normalize_logs_script, raw_logs, tui) if tui.normalize_logs else raw_logs
+                            original_logs = logs
                             
                             # Apply filters if active
                             if filtering_active or time_filter_active:
@@ -1811,27 +2547,25 @@ def show_logs(tui, stdscr, container):
                                 
                                 # Then apply text filter if active
                                 if filtering_active:
-                                    filtered_logs, filtered_line_map = filter_logs(filtered_logs, filter_string, case_sensitive)
+                                    filtered_logs, filtered_line_map = filter_logs(filtered_logs, filter_string, case_sensitive, lower_cache=lower_cache, filter_cache=filter_cache)
                                 
                                 logs = filtered_logs
                             
                             # Rebuild pad
-                            pad_info = rebuild_log_pad(logs, w, h, tui.wrap_log_lines)
+                            pad_info = rebuild_log_pad(logs, w, h, tui.wrap_log_lines, pad_info)
                             pad = pad_info['pad']
                             line_positions = pad_info['line_positions']
                             actual_lines_count = pad_info['actual_lines']
                             
                             # Update line count
                             last_logical_lines_count = len(logs)
-                            last_log_line = logs[-1] if logs else ""
-                            last_log_count = len(logs)
                             
                             # Reapply search if needed
                             if search_string:
-                                search_result = search_and_highlight(pad, logs, search_string, line_positions, w, case_sensitive, pos)
+                                search_result = search_and_highlight(pad, logs, search_string, line_positions, w, case_sensitive, pos, lower_cache, search_cache)
                                 search_matches = search_result['matches']
                                 current_match = search_result['current_match']
-                                highlight_search_matches(pad, line_positions, tui.wrap_log_lines, w, search_matches, current_match)
+                                highlighted_pad_info = None  # Visible highlights are repainted on the next frame
                             
                             # Go to end if in follow mode
                             if follow_mode:
@@ -1872,11 +2606,11 @@ def show_logs(tui, stdscr, container):
                                     )
                                     
                                     # Store raw logs for reference
-                                    all_raw_logs = raw_logs.copy()
+                                    all_raw_logs = deque(raw_logs, maxlen=MAX_LOG_LINES)
                                     
                                     # Process logs through normalize_logs.py if needed
-                                    logs = normalize_container_logs(tui.normalize_logs, tui.normalize_logs_script, raw_logs) if tui.normalize_logs else raw_logs
-                                    original_logs = logs.copy()  # These are now the time-filtered logs
+                                    logs = normalize_container_logs(tui.normalize_logs, tui.normalize_logs_script, raw_logs, tui) if tui.normalize_logs else raw_logs
+                                    original_logs = logs  # These are now the time-filtered logs
                                     time_filter_active = True
                                     
                                     # Show warning if logs were truncated for safety
@@ -1888,7 +2622,7 @@ def show_logs(tui, stdscr, container):
                                     
                                     # Apply text filtering if it was active before
                                     if filtering_active:
-                                        filtered_logs, filtered_line_map = filter_logs(logs, filter_string, case_sensitive)
+                                        filtered_logs, filtered_line_map = filter_logs(logs, filter_string, case_sensitive, lower_cache=lower_cache, filter_cache=filter_cache)
                                         logs = filtered_logs
                                     
                                 except Exception as e:
@@ -1901,14 +2635,14 @@ def show_logs(tui, stdscr, container):
                                     # If text filtering is also active, apply it to time-filtered logs
                                     if filtering_active:
                                         filtered_logs, filtered_line_map = filter_logs(
-                                            time_filtered_logs, filter_string, case_sensitive
+                                            time_filtered_logs, filter_string, case_sensitive, lower_cache=lower_cache, filter_cache=filter_cache
                                         )
                                         logs = filtered_logs
                                     else:
                                         logs = time_filtered_logs
                                 
                                 # Rebuild pad
-                                pad_info = rebuild_log_pad(logs, w, h, tui.wrap_log_lines)
+                                pad_info = rebuild_log_pad(logs, w, h, tui.wrap_log_lines, pad_info)
                                 pad = pad_info['pad']
                                 line_positions = pad_info['line_positions']
                                 actual_lines_count = pad_info['actual_lines']
@@ -1944,25 +2678,24 @@ def show_logs(tui, stdscr, container):
                                 safe_addstr(stdscr, h//2, (w-25)//2, "Reloading full logs...", curses.A_BOLD)
                                 stdscr.refresh()
                                 
-                                # Reload all logs
-                                if tail_lines == 0:
-                                    raw_logs = container.logs().decode(errors='ignore').splitlines()
-                                else:
-                                    raw_logs = container.logs(tail=tail_lines).decode(errors='ignore').splitlines()
+                                # Reload all logs and resume following from the newest line
+                                raw_logs, last_log_time_iso = fetch_container_logs(container, tail=tail_lines)
+                                log_streaming = start_log_stream(tui, container, last_log_time_iso)
+                                all_raw_logs = deque(raw_logs, maxlen=MAX_LOG_LINES)
                                 
                                 # Process logs
-                                logs = normalize_container_logs(tui.normalize_logs, tui.normalize_logs_script, raw_logs) if tui.normalize_logs else raw_logs
-                                original_logs = logs.copy()
+                                logs = normalize_container_logs(tui.normalize_logs, tui.normalize_logs_script, raw_logs, tui) if tui.normalize_logs else raw_logs
+                                original_logs = logs
                                 
                                 # Apply text filtering if active
                                 if filtering_active:
                                     filtered_logs, filtered_line_map = filter_logs(
-                                        original_logs, filter_string, case_sensitive
+                                        original_logs, filter_string, case_sensitive, lower_cache=lower_cache, filter_cache=filter_cache
                                     )
                                     logs = filtered_logs
                                 
                                 # Rebuild pad
-                                pad_info = rebuild_log_pad(logs, w, h, tui.wrap_log_lines)
+                                pad_info = rebuild_log_pad(logs, w, h, tui.wrap_log_lines, pad_info)
                                 pad = pad_info['pad']
                                 line_positions = pad_info['line_positions']
                                 actual_lines_count = pad_info['actual_lines']
@@ -2020,6 +2753,7 @@ def show_logs(tui, stdscr, container):
                             next_match = next_search_match(search_matches, current_match, line_positions, tui.wrap_log_lines, w)
                             if next_match:
                                 pos = next_match['position']
+                                move_current_match(pad, line_positions, tui.wrap_log_lines, w, search_matches, current_match, next_match['match_index'])
                                 current_match = next_match['match_index']
                             follow_mode = False
                         elif ch == ord('N') and search_string and search_matches:
@@ -2027,6 +2761,7 @@ def show_logs(tui, stdscr, container):
                             prev_match = prev_search_match(search_matches, current_match, line_positions, tui.wrap_log_lines, w)
                             if prev_match:
                                 pos = prev_match['position']
+                                move_current_match(pad, line_positions, tui.wrap_log_lines, w, search_matches, current_match, prev_match['match_index'])
                                 current_match = prev_match['match_index']
                             follow_mode = False
                         elif ch == ord('n'):  # Only 'n' toggles normalization when not searching
@@ -2034,8 +2769,9 @@ def show_logs(tui, stdscr, container):
                             
                             # Renormalize or revert to raw logs
                             if tui.normalize_logs:
-                                # Normalize the original logs first
-                                normalized_original = normalize_container_logs(tui.normalize_logs, tui.normalize_logs_script, all_raw_logs)
+                                # Normalize the original logs first (from a list snapshot, since the
+                                # fallbacks hand their input back as original_logs)
+                                normalized_original = normalize_container_logs(tui.normalize_logs, tui.normalize_logs_script, list(all_raw_logs), tui)
                                 original_logs = normalized_original
                                 
                                 # If filtering is active, apply filters to normalized logs
@@ -2049,14 +2785,15 @@ def show_logs(tui, stdscr, container):
                                     
                                     # Then apply text filter if active
                                     if filtering_active:
-                                        filtered_logs, filtered_line_map = filter_logs(filtered_logs, filter_string, case_sensitive)
+                                        filtered_logs, filtered_line_map = filter_logs(filtered_logs, filter_string, case_sensitive, lower_cache=lower_cache, filter_cache=filter_cache)
                                     
                                     logs = filtered_logs
                                 else:
                                     logs = original_logs
                             else:
-                                # Use raw logs
-                                original_logs = all_raw_logs.copy()
+                                # Use raw logs (as a list, since the views index into it and the
+                                # follow tick extends original_logs in place, so it cannot alias all_raw_logs)
+                                original_logs = list(all_raw_logs)
                                 
                                 # If filtering is active, apply filters to raw logs
                                 if filtering_active or time_filter_active:
@@ -2069,14 +2806,14 @@ def show_logs(tui, stdscr, container):
                                     
                                     # Then apply text filter if active
                                     if filtering_active:
-                                        filtered_logs, filtered_line_map = filter_logs(filtered_logs, filter_string, case_sensitive)
+                                        filtered_logs, filtered_line_map = filter_logs(filtered_logs, filter_string, case_sensitive, lower_cache=lower_cache, filter_cache=filter_cache)
                                     
                                     logs = filtered_logs
                                 else:
                                     logs = original_logs
                             
                             # Rebuild pad with updated content
-                            pad_info = rebuild_log_pad(logs, w, h, tui.wrap_log_lines)
+                            pad_info = rebuild_log_pad(logs, w, h, tui.wrap_log_lines, pad_info)
                             pad = pad_info['pad']
                             line_positions = pad_info['line_positions']
                             actual_lines_count = pad_info['actual_lines']
@@ -2085,23 +2822,15 @@ def show_logs(tui, stdscr, container):
                             last_logical_lines_count = len(logs)
                             
                             # Update header immediately
-                            stdscr.attron(curses.color_pair(5))
-                            normalized_indicator = " [NORMALIZED]" if tui.normalize_logs else " [RAW]"
-                            wrap_indicator = " [WRAP]" if tui.wrap_log_lines else " [NOWRAP]"
-                            search_indicator = f" [SEARCH: {search_string}]" if search_string else ""
-                            filter_indicator = get_filter_indicator(filter_string) if filtering_active else ""
-                            tail_indicator = f" [TAIL: {tail_lines if tail_lines > 0 else 'ALL'}]"
-                            header_text = f" Logs: {container.name} " + (" [FOLLOW]" if follow_mode else " [STATIC]") + normalized_indicator + wrap_indicator + tail_indicator + search_indicator + filter_indicator
-                            safe_addstr(stdscr, 0, (w-len(header_text))//2, header_text, curses.color_pair(5) | curses.A_BOLD)
-                            stdscr.attroff(curses.color_pair(5))
-                            stdscr.refresh()
+                            paint_log_header(stdscr, w, render_header(container.name, follow_mode, tui.normalize_logs, tui.wrap_log_lines, tail_lines, search_string, filter_string if filtering_active else ""))
+                            last_display_time = 0  # The next draw tick flushes this with the pad in one update
                             
                             # Reapply search if needed
                             if search_string:
-                                search_result = search_and_highlight(pad, logs, search_string, line_positions, w, case_sensitive, pos)
+                                search_result = search_and_highlight(pad, logs, search_string, line_positions, w, case_sensitive, pos, lower_cache, search_cache)
                                 search_matches = search_result['matches']
                                 current_match = search_result['current_match']
-                                highlight_search_matches(pad, line_positions, tui.wrap_log_lines, w, search_matches, current_match)
+                                highlighted_pad_info = None  # Visible highlights are repainted on the next frame
                             
                             # Maintain position proportionally
                             if last_logical_lines_count > 0:
@@ -2115,60 +2844,36 @@ def show_logs(tui, stdscr, container):
                         if tui.wrap_log_lines:
                             h_scroll = 0
                         
-                        # Rebuild pad with new wrapping setting
-                        pad_info = rebuild_log_pad(logs, w, h, tui.wrap_log_lines)
+                        # Logical line at the top of the screen, looked up before the rows move
+                        top_line = logical_line_at(line_positions, pos)
+                        
+                        # Swap in the pad for the other wrap mode, rebuilding it only if the logs changed
+                        pad_info, spare_pad = swap_log_pad(logs, w, h, tui.wrap_log_lines, pad_info, spare_pad, restore=not search_string)
                         pad = pad_info['pad']
                         line_positions = pad_info['line_positions']
                         actual_lines_count = pad_info['actual_lines']
                         
                         # Update footer immediately to show horizontal scroll keys if unwrapped
-                        if filtering_active or time_filter_active:
-                            if tui.wrap_log_lines:
-                                footer_text = " ↑/↓:Scroll | F:Follow | R:Time | E:Export | /:Search | \\:Filter | ESC:Clear | Q:Back "
-                            else:
-                                footer_text = " ↑/↓:Scroll | ←/→:H-Scroll | F:Follow | R:Time | E:Export | /:Search | \\:Filter | ESC:Clear | Q:Back "
-                        elif tui.wrap_log_lines:
-                            footer_text = " ↑/↓:Scroll | PgUp/Dn | F:Follow | N:Normalize | W:Wrap | T:Tail | R:Time | E:Export | /:Search | \\:Filter | ESC:Back "
-                        else:
-                            footer_text = " ↑/↓:Scroll | ←/→:H-Scroll | PgUp/Dn | F:Follow | N:Normalize | W:Wrap | T:Tail | R:Time | E:Export | /:Search | \\:Filter | ESC:Back "
+                        footer_text = LOG_VIEW_FOOTERS[(filtering_active or time_filter_active, tui.wrap_log_lines)]
                         
                         stdscr.attron(curses.color_pair(6))
                         safe_addstr(stdscr, h-1, 0, footer_text + " " * (w - len(footer_text)), curses.color_pair(6))
                         stdscr.attroff(curses.color_pair(6))
                         
                         # Update header immediately to reflect changed wrapping mode
-                        stdscr.attron(curses.color_pair(5))
-                        normalized_indicator = " [NORMALIZED]" if tui.normalize_logs else " [RAW]"
-                        wrap_indicator = " [WRAP]" if tui.wrap_log_lines else " [NOWRAP]"
-                        search_indicator = f" [SEARCH: {search_string}]" if search_string else ""
-                        filter_indicator = f" [FILTER: {filter_string}]" if filtering_active else ""
-                        tail_indicator = f" [TAIL: {tail_lines if tail_lines > 0 else 'ALL'}]"
-                        header_text = f" Logs: {container.name} " + (" [FOLLOW]" if follow_mode else " [STATIC]") + normalized_indicator + wrap_indicator + tail_indicator + search_indicator + filter_indicator
-                        safe_addstr(stdscr, 0, (w-len(header_text))//2, header_text, curses.color_pair(5) | curses.A_BOLD)
-                        stdscr.attroff(curses.color_pair(5))
-                        stdscr.refresh()
+                        paint_log_header(stdscr, w, render_header(container.name, follow_mode, tui.normalize_logs, tui.wrap_log_lines, tail_lines, search_string, filter_string if filtering_active else ""))
+                        last_display_time = 0  # The next draw tick flushes this with the pad in one update
                         
                         # Reapply search if needed
                         if search_string:
-                            search_result = search_and_highlight(pad, logs, search_string, line_positions, w, case_sensitive, pos)
+                            search_result = search_and_highlight(pad, logs, search_string, line_positions, w, case_sensitive, pos, lower_cache, search_cache)
                             search_matches = search_result['matches']
                             current_match = search_result['current_match']
-                            highlight_search_matches(pad, line_positions, tui.wrap_log_lines, w, search_matches, current_match)
+                            highlighted_pad_info = None  # Visible highlights are repainted on the next frame
                         
-                        # Maintain position proportionally
-                        if actual_lines_count > 0:
-                            # Try to keep the same logical line visible
-                            logical_pos = 0
-                            for i, line_pos in enumerate(line_positions):
-                                if line_pos > pos:
-                                    break
-                                logical_pos = i
-                            
-                            # Go to that logical line in new pad
-                            if logical_pos < len(line_positions):
-                                pos = line_positions[logical_pos]
-                            else:
-                                pos = 0
+                        # Keep the same logical line at the top in the new pad
+                        if actual_lines_count > 0 and top_line < len(line_positions):
+                            pos = line_positions[top_line]
                         else:
                             pos = 0
                     elif ch == ord('/'):  # Start search
@@ -2176,42 +2881,22 @@ def show_logs(tui, stdscr, container):
                         search_input = search_string  # Initialize with previous search
                         
                         # Show search prompt
-                        search_prompt = " Search: "
-                        stdscr.attron(curses.color_pair(6))
-                        safe_addstr(stdscr, h-1, 0, search_prompt, curses.color_pair(6) | curses.A_BOLD)
-                        safe_addstr(stdscr, h-1, len(search_prompt), search_input + " " * (w - len(search_prompt) - len(search_input) - 1), curses.color_pair(6))
-                        
-                        # Show case sensitivity indicator
-                        case_text = "Case: " + ("ON" if case_sensitive else "OFF") + " (Tab)"
-                        safe_addstr(stdscr, h-1, w - len(case_text) - 1, case_text, curses.color_pair(6) | curses.A_BOLD)
-                        stdscr.attroff(curses.color_pair(6))
+                        cursor_x = paint_prompt_row(stdscr, h, w, SEARCH_PROMPT, search_input, SEARCH_CASE_TEXT[case_sensitive])
                         
                         curses.curs_set(1)  # Show cursor
-                        stdscr.move(h-1, len(search_prompt) + len(search_input))
-                        stdscr.refresh()
+                        stdscr.move(h-1, cursor_x)
+                        stdscr.noutrefresh()  # Flushed when the prompt loop refreshes
                     elif ch == ord('\\'):  # Start filter
                         filter_mode = True
                         filter_input = filter_string  # Initialize with previous filter
                         
                         # Show filter prompt
-                        filter_prompt = " Filter: "
-                        stdscr.attron(curses.color_pair(6))
-                        safe_addstr(stdscr, h-1, 0, filter_prompt, curses.color_pair(6) | curses.A_BOLD)
-                        safe_addstr(stdscr, h-1, len(filter_prompt), filter_input + " " * (w - len(filter_prompt) - len(filter_input) - 1), curses.color_pair(6))
-                        
-                        # Show filter help
-                        help_text = "Syntax: term AND/OR term, (term OR term), +include -exclude \"multi word\" | Tab:Case"
-                        if w > len(help_text) + 15:
-                            safe_addstr(stdscr, h-2, (w - len(help_text)) // 2, help_text, curses.A_DIM)
-                        
-                        # Show case sensitivity indicator
-                        case_text = "Case: " + ("ON" if case_sensitive else "OFF")
-                        safe_addstr(stdscr, h-1, w - len(case_text) - 1, case_text, curses.color_pair(6) | curses.A_BOLD)
-                        stdscr.attroff(curses.color_pair(6))
+                        cursor_x = paint_prompt_row(stdscr, h, w, FILTER_PROMPT, filter_input, FILTER_CASE_TEXT[case_sensitive])
+                        paint_filter_help(stdscr, h, w)
                         
                         curses.curs_set(1)  # Show cursor
-                        stdscr.move(h-1, len(filter_prompt) + len(filter_input))
-                        stdscr.refresh()
+                        stdscr.move(h-1, cursor_x)
+                        stdscr.noutrefresh()  # Flushed when the prompt loop refreshes
                     elif ch == curses.KEY_RIGHT and not tui.wrap_log_lines:  # Right arrow for horizontal scroll
                         # Only allow horizontal scrolling in unwrapped mode
                         h_scroll = min(h_scroll + 10, max_line_length - (w - 5))
@@ -2221,27 +2906,28 @@ def show_logs(tui, stdscr, container):
                     elif ch == curses.KEY_MOUSE:
                         try:
                             _, mx, my, _, button_state = curses.getmouse()
+                        except curses.error:
+                            button_state = 0  # No event queued after all
+                        if button_state:
                             # Scroll with mouse wheel
-                            if button_state & curses.BUTTON4_PRESSED:  # Wheel up
+                            if button_state & MOUSE_WHEEL_UP:
                                 pos = max(0, pos - 3)
                                 follow_mode = False
-                            elif button_state & curses.BUTTON5_PRESSED:  # Wheel down
+                            elif button_state & MOUSE_WHEEL_DOWN:
                                 pos = min(actual_lines_count - 1, pos + 3)
                                 follow_mode = False
                             # Horizontal scrolling with Shift+wheel or horizontal wheel
-                            elif not tui.wrap_log_lines and button_state & (1 << 8):  # Horizontal wheel left
+                            elif not tui.wrap_log_lines and button_state & MOUSE_WHEEL_LEFT:
                                 h_scroll = max(0, h_scroll - 10)
-                            elif not tui.wrap_log_lines and button_state & (1 << 9):  # Horizontal wheel right
+                            elif not tui.wrap_log_lines and button_state & MOUSE_WHEEL_RIGHT:
                                 h_scroll = min(h_scroll + 10, max_line_length - (w - 5))
                                 h_scroll = max(0, h_scroll)
                             # Click on scrollbar to jump
-                            elif button_state & curses.BUTTON1_CLICKED and mx == w-1 and 2 <= my < h-2:
+                            elif button_state & MOUSE_CLICK and mx == w-1 and 2 <= my < h-2:
                                 # Calculate position from click on scrollbar
                                 click_percent = (my - 2) / (h - 4)
                                 pos = int(click_percent * actual_lines_count)
                                 follow_mode = False
-                        except curses.error:
-                            pass
                     elif ch in (27, ord('q'), ord('Q')):  # ESC or Q to exit
                         # If filtering is active and ESC is pressed, clear the filters first
                         if ch == 27 and (filtering_active or time_filter_active):
@@ -2253,7 +2939,7 @@ def show_logs(tui, stdscr, container):
                             logs = original_logs
                             
                             # Rebuild pad with all logs
-                            pad_info = rebuild_log_pad(logs, w, h, tui.wrap_log_lines)
+                            pad_info = rebuild_log_pad(logs, w, h, tui.wrap_log_lines, pad_info)
                             pad = pad_info['pad']
                             line_positions = pad_info['line_positions']
                             actual_lines_count = pad_info['actual_lines']
@@ -2263,21 +2949,13 @@ def show_logs(tui, stdscr, container):
                             
                             # Apply search highlighting if there's a search pattern
                             if search_string:
-                                search_result = search_and_highlight(pad, logs, search_string, line_positions, w, case_sensitive, pos)
+                                search_result = search_and_highlight(pad, logs, search_string, line_positions, w, case_sensitive, pos, lower_cache, search_cache)
                                 search_matches = search_result['matches']
                                 current_match = search_result['current_match']
-                                highlight_search_matches(pad, line_positions, tui.wrap_log_lines, w, search_matches, current_match)
+                                highlighted_pad_info = None  # Visible highlights are repainted on the next frame
                             
                             # Update header without filter info
-                            stdscr.attron(curses.color_pair(5))
-                            safe_addstr(stdscr, 0, 0, " " * w)
-                            normalized_indicator = " [NORMALIZED]" if tui.normalize_logs else " [RAW]"
-                            wrap_indicator = " [WRAP]" if tui.wrap_log_lines else " [NOWRAP]"
-                            search_indicator = f" [SEARCH: {search_string}]" if search_string else ""
-                            tail_indicator = f" [TAIL: {tail_lines if tail_lines > 0 else 'ALL'}]"
-                            header_text = f" Logs: {container.name} " + (" [FOLLOW]" if follow_mode else " [STATIC]") + normalized_indicator + wrap_indicator + tail_indicator + search_indicator
-                            safe_addstr(stdscr, 0, (w-len(header_text))//2, header_text, curses.color_pair(5) | curses.A_BOLD)
-                            stdscr.attroff(curses.color_pair(5))
+                            paint_log_header(stdscr, w, render_header(container.name, follow_mode, tui.normalize_logs, tui.wrap_log_lines, tail_lines, search_string, ""))
                             
                             # Clear filter info from status line
                             safe_addstr(stdscr, 1, 0, " " * 30)
@@ -2287,8 +2965,7 @@ def show_logs(tui, stdscr, container):
                                 match_info = f" {current_match + 1}/{len(search_matches)} matches "
                                 safe_addstr(stdscr, 1, 0, match_info, curses.A_BOLD)
                             
-                            # Force refresh
-                            stdscr.refresh()
+                            last_display_time = 0  # The next draw tick flushes this with the pad in one update
                         else:
                             running = False
     
@@ -2310,6 +2987,10 @@ def show_logs(tui, stdscr, container):
         stdscr.getch()
     
     finally:
+        # Stop the log stream and normalizer process used for this log session
+        stop_log_stream(tui)
+        close_normalize_process(tui)
+        
         # Restore screen state
         stdscr.clear()
         stdscr.nodelay(True)  # Restore non-blocking mode
@@ -671,7 +671,9 @@ class LogViewScreen(Screen):
             self.raw_logs.extend(new_lines)
             self.raw_logs_with_timestamps.extend(new_lines_with_ts)
 
-        if len(self.raw_logs) > self.max_lines:
+        # Trim with some slack: every trim copies the buffer and redraws the
+        # whole view, so it should not happen on every poll once at the cap
+        if len(self.raw_logs) > self.max_lines + self.max_lines // 10:
             self.raw_logs = self.raw_logs[-self.max_lines :]
             self.raw_logs_with_timestamps = self.raw_logs_with_timestamps[-self.max_lines :]
             trimmed = True
@@ -959,7 +961,9 @@ class LogViewScreen(Screen):
         if not tokens:
             return True
         
-        flags = 0 if self.case_sensitive else re.IGNORECASE
+        # Lowercase the line once rather than matching every term case-insensitively
+        case_sensitive = self.case_sensitive
+        haystack = line if case_sensitive else line.lower()
         
         def evaluate_term(term: str, line: str) -> bool:
             """Evaluate a single term against the line."""
@@ -967,8 +971,7 @@ class LogViewScreen(Screen):
             if term.startswith('!') or term.startswith('-'):
                 search_term = term[1:]
                 if search_term:
-                    pattern = re.compile(re.escape(search_term), flags)
-                    return not pattern.search(line)
+                    return (search_term if case_sensitive else search_term.lower()) not in haystack
                 return True
             # Handle explicit inclusion
             elif term.startswith('+'):
@@ -977,8 +980,7 @@ class LogViewScreen(Screen):
                 search_term = term
             
             if search_term:
-                pattern = re.compile(re.escape(search_term), flags)
-                return bool(pattern.search(line))
+                return (search_term if case_sensitive else search_term.lower()) in haystack
             return True
         
         def parse_expression(pos: int = 0) -> Tuple[bool, int]:
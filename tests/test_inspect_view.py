@@ -0,0 +1,13 @@
+"""Tests for the inspect view search helpers."""
+from dtop.views import inspect_view as iv
+
+
+def test_find_literal_spans_case_insensitive():
+    assert list(iv.find_literal_spans("Error error ERROR", "error")) == [(0, 5), (6, 11), (12, 17)]
+    assert list(iv.find_literal_spans("Error error", "error", case_sensitive=True)) == [(6, 11)]
+
+
+def test_find_literal_spans_columns_survive_lowercasing_that_changes_length():
+    # "İ".lower() is two code points, which would shift every later offset
+    assert list(iv.find_literal_spans("İİ error", "error")) == [(3, 8)]
+    assert list(iv.find_literal_spans("İİ ERROR", "error")) == [(3, 8)]
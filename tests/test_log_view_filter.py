@@ -0,0 +1,652 @@
+"""Tests for the legacy curses log view filter and search helpers."""
+import array
+import time
+
+import pytest
+from dtop.views import log_view as lv
+
+
+LOGS = [
+    "INFO server started",
+    "DEBUG cache warm",
+    "ERROR disk full",
+    "info retrying request",
+    "WARN slow response from upstream",
+]
+
+
+def test_filter_logs_no_filter_returns_everything():
+    filtered, line_map = lv.filter_logs(LOGS, "")
+    assert filtered == LOGS
+    assert line_map.tolist() == list(range(len(LOGS)))
+
+
+def test_filter_logs_single_term_is_case_insensitive_by_default():
+    filtered, line_map = lv.filter_logs(LOGS, "info")
+    assert filtered == ["INFO server started", "info retrying request"]
+    assert line_map.tolist() == [0, 3]
+
+
+def test_filter_logs_case_sensitive():
+    filtered, line_map = lv.filter_logs(LOGS, "info", case_sensitive=True)
+    assert filtered == ["info retrying request"]
+    assert line_map.tolist() == [3]
+
+
+def test_filter_logs_exclusion_terms():
+    filtered, _ = lv.filter_logs(LOGS, "-debug !warn")
+    assert filtered == ["INFO server started", "ERROR disk full", "info retrying request"]
+
+
+def test_filter_logs_and_or_with_parentheses():
+    filtered, _ = lv.filter_logs(LOGS, "(error OR warn) AND full")
+    assert filtered == ["ERROR disk full"]
+    filtered, _ = lv.filter_logs(LOGS, "error OR debug")
+    assert filtered == ["DEBUG cache warm", "ERROR disk full"]
+
+
+def test_filter_logs_quoted_phrase():
+    filtered, _ = lv.filter_logs(LOGS, '"slow response"')
+    assert filtered == ["WARN slow response from upstream"]
+
+
+def test_filter_logs_bare_operator_matches_everything():
+    filtered, _ = lv.filter_logs(LOGS, "+")
+    assert filtered == LOGS
+
+
+def test_evaluate_filter_accepts_raw_and_compiled_tokens():
+    tokens = lv.parse_filter_expression("error -disk")
+    compiled = lv.compile_filter(tokens)
+    for line in LOGS:
+        assert lv.evaluate_filter(tokens, line) == lv.evaluate_filter(compiled, line)
+
+
+def test_search_finds_all_non_overlapping_matches():
+    result = lv.search_and_highlight(None, ["aaaa", "xa", "none"], "aa", [0, 1, 2], 80)
+    assert result["matches"] == [(0, 0, 2), (0, 2, 2)]
+    assert result["current_match"] == 0
+
+
+def test_search_case_sensitivity():
+    logs = ["Error one", "error two"]
+    result = lv.search_and_highlight(None, logs, "error", [0, 1], 80)
+    assert [m[0] for m in result["matches"]] == [0, 1]
+    result = lv.search_and_highlight(None, logs, "error", [0, 1], 80, case_sensitive=True)
+    assert result["matches"] == [(1, 0, 5)]
+
+
+def test_search_columns_survive_lowercasing_that_changes_length():
+    # "İ".lower() is two code points, which would shift every later offset
+    logs = ["İİ error", "plain error"]
+    result = lv.search_and_highlight(None, logs, "error", [0, 1], 80)
+    assert result["matches"] == [(0, 3, 5), (1, 6, 5)]
+    result = lv.search_and_highlight(None, logs * 40, "ERROR", list(range(80)), 80, lower_cache={})
+    assert result["matches"][:2] == [(0, 3, 5), (1, 6, 5)]
+
+
+def test_search_current_match_follows_start_pos():
+    logs = ["hit", "miss", "hit", "hit"]
+    result = lv.search_and_highlight(None, logs, "hit", [0, 1, 2, 3], 80, start_pos=2)
+    assert result["matches"][result["current_match"]][0] == 2
+
+
+def test_get_lowered_logs_extends_on_append():
+    cache = {}
+    logs = ["A", "B"]
+    lowered = lv.get_lowered_logs(logs, cache)
+    assert lowered == ["a", "b"]
+    logs.append("C")
+    again = lv.get_lowered_logs(logs, cache)
+    assert again is lowered
+    assert again == ["a", "b", "c"]
+
+
+def test_filter_and_search_share_lower_cache():
+    cache = {}
+    filtered, _ = lv.filter_logs(LOGS, "INFO", lower_cache=cache)
+    assert filtered == ["INFO server started", "info retrying request"]
+    result = lv.search_and_highlight(None, LOGS, "INFO", list(range(len(LOGS))), 80, lower_cache=cache)
+    assert [m[0] for m in result["matches"]] == [0, 3]
+    assert id(LOGS) in cache
+
+
+def test_parse_filter_expression_is_memoized_and_immutable():
+    first = lv.parse_filter_expression("a b")
+    assert first == (("TERM", "a"), ("AND", "AND"), ("TERM", "b"))
+    assert lv.parse_filter_expression("a b") is first
+    assert lv.get_compiled_filter("a b") is lv.get_compiled_filter("a b")
+
+
+def test_match_pad_position_wrapped_and_unwrapped():
+    line_positions = [0, 3, 4]
+    # w=13 gives wrapped segments 10 characters wide
+    assert lv.match_pad_position(line_positions, 0, 25, True, 13) == (2, 5)
+    assert lv.match_pad_position(line_positions, 1, 10, True, 13) == (4, 0)
+    assert lv.match_pad_position(line_positions, 2, 25, False, 13) == (4, 25)
+
+
+def test_next_and_prev_search_match_wrap_around():
+    matches = [(0, 0, 1), (1, 12, 1)]
+    line_positions = [0, 1]
+    nxt = lv.next_search_match(matches, 0, line_positions, True, 13)
+    assert nxt == {"position": 2, "match_index": 1}
+    prev = lv.prev_search_match(matches, 0, line_positions, True, 13)
+    assert prev["match_index"] == 1
+
+
+def test_search_current_match_wraps_when_all_matches_are_above():
+    logs = ["hit", "miss", "miss", "miss"]
+    result = lv.search_and_highlight(None, logs, "hit", [0, 1, 2, 3], 80, start_pos=3)
+    assert result["current_match"] == 0
+
+
+def test_normalize_container_logs_reuses_process():
+    import types
+    from pathlib import Path
+
+    script = str(Path(lv.__file__).resolve().parent.parent / "utils" / "normalize_logs.py")
+    tui = types.SimpleNamespace()
+    raw = '{"severity":"INFO","timestamp":"2024-01-15T12:00:00.000000000Z","message":"ping"}'
+    try:
+        out = lv.normalize_container_logs(True, script, [raw, "plain text"], tui)
+        assert len(out) == 2
+        assert "INFO" in out[0] and "ping" in out[0]
+        assert out[1] == "plain text"
+        process = tui._normalize_proc
+        assert lv.normalize_container_logs(True, script, ["again"], tui) == ["again"]
+        assert tui._normalize_proc is process
+    finally:
+        lv.close_normalize_process(tui)
+    assert tui._normalize_proc is None
+
+
+def test_normalize_cache_only_sends_unseen_lines(monkeypatch, tmp_path):
+    import types
+
+    script = tmp_path / "normalize_logs.py"
+    script.write_text("")
+    sent = []
+
+    def fake_normalize(tui, normalize_script, lines, timeout):
+        sent.append(list(lines))
+        return [line.upper() for line in lines]
+
+    monkeypatch.setattr(lv, "_normalize_with_process", fake_normalize)
+    tui = types.SimpleNamespace()
+    assert lv.normalize_container_logs(True, str(script), ["a", "b", "a"], tui) == ["A", "B", "A"]
+    assert lv.normalize_container_logs(True, str(script), ["b", "c"], tui) == ["B", "C"]
+    assert sent == [["a", "b"], ["c"]]
+    lv.close_normalize_process(tui)
+    assert tui._normalize_cache is None
+
+
+def test_close_normalize_process_after_timeout_with_blocked_writer(tmp_path):
+    import subprocess
+    import sys
+    import types
+
+    # A normalizer that never reads leaves the writer thread stuck on a full pipe
+    script = tmp_path / "normalize_logs.py"
+    script.write_text(f"#!{sys.executable}\nimport time\ntime.sleep(30)\n")
+    script.chmod(0o755)
+    tui = types.SimpleNamespace()
+    with pytest.raises(subprocess.TimeoutExpired):
+        lv._normalize_with_process(tui, str(script), ["x" * 1000] * 1000, timeout=0.2)
+    process, writer = tui._normalize_proc, tui._normalize_writer
+    assert writer.is_alive()
+
+    started = time.monotonic()
+    lv.close_normalize_process(tui)
+    assert time.monotonic() - started < 2
+    assert process.poll() is not None
+    assert not writer.is_alive()
+    assert process.stdin.closed and process.stdout.closed
+    assert tui._normalize_proc is None and tui._normalize_writer is None
+
+
+def test_filter_batch_matches_per_line_evaluation():
+    expressions = [
+        "info",
+        "-debug",
+        "error OR warn",
+        "(error OR warn) AND -disk",
+        "info AND server OR retrying",
+        "+ -",
+        "slow (response",
+        "AND info",
+        "r +e -disk",
+        "-debug -warn info",
+        "- info",
+        "warn OR info OR disk",
+    ]
+    for expr in expressions:
+        compiled = lv.get_compiled_filter(expr)
+        expected = [i for i, line in enumerate(LOGS) if lv.evaluate_filter(compiled, line)]
+        assert lv.evaluate_filter_batch(compiled, [l.lower() for l in LOGS]) == expected, expr
+
+
+def test_pad_capacity_grows_geometrically():
+    assert lv.pad_capacity_for(1) == 1024
+    assert lv.pad_capacity_for(1024) == 1024
+    assert lv.pad_capacity_for(1025) == 2048
+    assert lv.pad_capacity_for(17100) == lv.MAX_PAD_ROWS
+    assert lv.estimate_pad_rows([17, 0, 1], 10, False) == 3
+    # wrapped rows use width-3 columns, rounding up; empty lines take a row
+    assert lv.estimate_pad_rows([14, 0, 1, 7, 8], 10, True) == 7
+
+
+class _TimestampedContainer:
+    """Minimal stand-in that honours docker's inclusive since semantics"""
+
+    def __init__(self, entries):
+        self.entries = entries
+        self.calls = []
+
+    def logs(self, timestamps=False, tail=None, since=None):
+        self.calls.append({'tail': tail, 'since': since})
+        rows = self.entries
+        if since is not None:
+            rows = [r for r in rows if lv.docker_timestamp_to_epoch(r[0]) >= since]
+        if tail:
+            rows = rows[-tail:]
+        return "".join(f"{ts} {line}\n" for ts, line in rows).encode()
+
+
+def test_fetch_container_logs_resumes_after_last_timestamp():
+    container = _TimestampedContainer([
+        ("2024-01-15T12:00:00.1Z", "first"),
+        ("2024-01-15T12:00:00.12Z", "second"),
+    ])
+    lines, cursor = lv.fetch_container_logs(container, tail=500)
+    assert lines == ["first", "second"]
+    assert cursor == "2024-01-15T12:00:00.12Z"
+
+    # Nothing new: the inclusive since boundary must not repeat the last line
+    assert lv.fetch_container_logs(container, since_iso=cursor) == ([], cursor)
+
+    container.entries.append(("2024-01-15T12:00:01Z", "third"))
+    lines, cursor = lv.fetch_container_logs(container, since_iso=cursor)
+    assert lines == ["third"]
+    assert cursor == "2024-01-15T12:00:01Z"
+    assert container.calls[-1]['since'] == pytest.approx(1705320000.12)
+
+
+class _FakeStream:
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.closed = False
+
+    def __iter__(self):
+        return iter(self.chunks)
+
+    def close(self):
+        self.closed = True
+
+
+def test_log_stream_queues_lines_split_across_chunks():
+    import types
+    stream = _FakeStream([
+        b"2024-01-15T12:00:00.12Z already seen\n2024-01-15T12:00:01Z par",
+        b"tial\n2024-01-15T12:00:02Z done\n",
+    ])
+    container = types.SimpleNamespace(logs=lambda **kwargs: stream)
+    tui = types.SimpleNamespace()
+    assert lv.start_log_stream(tui, container, "2024-01-15T12:00:00.12Z")
+
+    lines, last_iso = [], None
+    for _ in range(200):
+        batch, batch_iso, alive = lv.drain_log_stream(tui)
+        lines += batch
+        last_iso = batch_iso or last_iso
+        if not alive:
+            break
+        time.sleep(0.01)
+    assert lines == ["partial", "done"]
+    assert last_iso == "2024-01-15T12:00:02Z"
+    assert stream.closed and tui._log_stream is None
+
+
+def test_joined_scan_matches_per_line_filter_and_tracks_growth():
+    logs = [f"line {i} " + ("needle" if i % 50 == 0 else "hay") for i in range(1000)] + ["", "needle"]
+    cache = {}
+    joined, starts = lv.get_joined_logs(logs, cache)
+    assert joined == "\n".join(logs)
+    assert list(starts) == [joined.index(line, start) for line, start in zip(logs, starts)]
+    assert lv.scan_joined_logs("needle", joined, starts, 1000) == {i for i, line in enumerate(logs) if "needle" in line}
+    assert lv.scan_joined_logs("hay", joined, starts, 10) is None
+
+    logs.extend(["more needle", "", "tail"])
+    joined, starts = lv.get_joined_logs(logs, cache)
+    assert joined == "\n".join(logs)
+    assert len(starts) == len(logs)
+    assert all(joined.startswith(line, start) for line, start in zip(logs, starts))
+
+    for expr in ["needle", "-needle", "hay AND -needle", "needle OR tail"]:
+        expected = [i for i, line in enumerate(logs) if lv.evaluate_filter(lv.get_compiled_filter(expr), line)]
+        assert lv.filter_logs(logs, expr, lower_cache=cache)[1].tolist() == expected, expr
+
+
+def test_filter_cache_scans_only_appended_lines():
+    logs = list(LOGS)
+    cache = {}
+    filtered, line_map = lv.filter_logs(logs, "info OR error", filter_cache=cache)
+    assert line_map.tolist() == [0, 2, 3]
+
+    logs.extend(["ERROR again", "debug noise"])
+    filtered, line_map = lv.filter_logs(logs, "info OR error", filter_cache=cache)
+    assert line_map.tolist() == [0, 2, 3, 5]
+    assert filtered == [logs[i] for i in line_map]
+    assert cache['scanned_upto'] == len(logs)
+
+    # A different filter or a different list starts over
+    assert lv.filter_logs(logs, "debug", filter_cache=cache)[1].tolist() == [1, 6]
+    assert lv.filter_logs(list(logs), "debug", filter_cache=cache)[1].tolist() == [1, 6]
+
+
+def test_render_header_reflects_view_state():
+    header = lv.render_header("web", True, False, True, 0, "oops", "error")
+    assert header == " Logs: web  [FOLLOW] [RAW] [WRAP] [TAIL: ALL] [SEARCH: oops] [FILTER: error] "
+    assert lv.render_header("web", False, True, False, 500, "", "") == " Logs: web  [STATIC] [NORMALIZED] [NOWRAP] [TAIL: 500]"
+
+
+def test_match_range_for_rows_selects_visible_matches():
+    import array
+    # Logical lines start at these pad rows (line 1 wraps over rows 2-4)
+    line_positions = array.array('i', [0, 2, 5, 6, 9])
+    matches = [(0, 0, 1), (1, 0, 1), (1, 40, 1), (2, 3, 1), (4, 0, 1)]
+    assert lv.match_range_for_rows(matches, line_positions, 3, 5) == (1, 4)
+    assert lv.match_range_for_rows(matches, line_positions, 6, 8) == (4, 4)
+    assert lv.match_range_for_rows(matches, line_positions, 0, 100) == (0, 5)
+
+
+def test_logical_line_at_maps_wrapped_rows_back_to_lines():
+    import array
+    line_positions = array.array('i', [0, 2, 5, 6])
+    assert [lv.logical_line_at(line_positions, row) for row in range(8)] == [0, 0, 1, 1, 1, 2, 3, 3]
+    assert lv.logical_line_at(array.array('i'), 3) == 0
+
+
+def test_conjunction_batch_narrows_with_joined_scan():
+    lowered = [l.lower() for l in LOGS]
+    joined = lv.get_joined_logs(lowered, {})
+    compiled = lv.get_compiled_filter("-full r e")
+    assert lv._is_plain_conjunction(compiled)
+    assert lv.evaluate_filter_batch(compiled, lowered, joined) == [0, 1, 3, 4]
+    assert not lv._is_plain_conjunction(lv.get_compiled_filter("error OR warn"))
+    compiled = lv.get_compiled_filter("warn OR info OR disk")
+    assert lv._is_plain_disjunction(compiled)
+    assert lv.evaluate_filter_batch(compiled, lowered, joined) == [0, 2, 3, 4]
+    assert not lv._is_plain_disjunction(lv.get_compiled_filter("warn OR -info"))
+    # Common terms give up on the joined scan and use the compiled predicate
+    many = [("warn " if i % 2 else "info ") + str(i) for i in range(300)]
+    joined = lv.get_joined_logs(many, {})
+    compiled = lv.get_compiled_filter("warn OR 7")
+    assert lv.evaluate_filter_batch(compiled, many, joined) == [
+        i for i, line in enumerate(many) if "warn" in line or "7" in line]
+
+
+
+def test_long_disjunction_with_common_term_uses_predicate():
+    logs = ["t1 info"] * 200 + ["x"] * 5000 + ["t249"]
+    expression = " OR ".join(f"t{i}" for i in range(250))
+    filtered, line_map = lv.filter_logs(logs, expression, lower_cache={})
+    assert len(filtered) == 201
+    assert line_map.tolist() == list(range(200)) + [5200]
+
+def test_search_over_joined_buffer_matches_line_scan():
+    logs = [f"line {i} " + ("Timeout timeout" if i % 50 == 7 else "ok info") for i in range(400)]
+    positions = list(range(len(logs)))
+    for needle, case_sensitive in (("timeout", False), ("Timeout", True), ("info", False), ("i", True)):
+        plain = lv.search_and_highlight(None, logs, needle, positions, 80, case_sensitive)
+        joined = lv.search_and_highlight(None, logs, needle, positions, 80, case_sensitive, lower_cache={})
+        assert joined == plain
+    assert len(plain["matches"]) > 400
+
+
+def test_filter_predicate_matches_mixed_expressions():
+    compiled = lv.get_compiled_filter("(error OR warn) AND -disk")
+    predicate = lv.get_filter_predicate(compiled)
+    assert [predicate(line) for line in ("error: net", "warn: disk", "info")] == [True, False, False]
+    assert lv.evaluate_filter_batch(compiled, ["error: net", "warn: disk", "warn"]) == [0, 2]
+    # Needles are embedded as literals, so quotes and backslashes stay data
+    predicate = lv.get_filter_predicate(lv.get_compiled_filter("it's OR c:\\tmp", True))
+    assert predicate("it's") and predicate("c:\\tmp") and not predicate("its")
+
+
+
+def test_filter_predicate_handles_hundreds_of_terms():
+    # Runs of one operator compile to flat source, far below the parser's nesting limit
+    logs = ["a z5", "b", "c", "a"] * 10
+    expression = "(a OR b) AND " + " AND ".join(f"-z{i}" for i in range(250))
+    filtered, _ = lv.filter_logs(logs, expression)
+    assert filtered == ["b", "a"] * 10
+    # Long alternating chains still nest; those fall back to walking the tokens
+    compiled = lv.get_compiled_filter(" ".join(f"a{i} OR b{i} AND" for i in range(300)) + " c")
+    predicate = lv.get_filter_predicate(compiled)
+    for line in ("a5", "b5 c", "a0", "b299 c", "x"):
+        assert predicate(line) == lv.evaluate_filter(compiled, line, case_sensitive=True)
+
+class _QueuedScreen:
+    def __init__(self, keys):
+        self.keys = list(keys)
+        self.timeouts = []
+
+    def timeout(self, ms):
+        self.timeouts.append(ms)
+
+    def getch(self):
+        return self.keys.pop(0) if self.keys else -1
+
+
+def test_read_prompt_text_decodes_utf8_burst_and_pushes_back_enter(monkeypatch):
+    pushed = []
+    monkeypatch.setattr(lv.curses, "ungetch", pushed.append)
+    screen = _QueuedScreen(list("caf".encode()[1:]) + list("é".encode()) + [10])
+    assert lv.read_prompt_text(screen, ord("c")) == "café"
+    assert pushed == [10]
+    assert screen.timeouts == [0, 100]
+    # A queued Backspace ends the burst and is handed back to the caller
+    pushed.clear()
+    assert lv.read_prompt_text(_QueuedScreen([ord("r"), 127, ord("x")]), ord("e")) == "er"
+    assert pushed == [127]
+
+
+def test_parse_filter_expression_tokenizer_edge_cases():
+    assert lv.parse_filter_expression('"a AND b" or (c)') == (
+        ('TERM', 'a AND b'), ('OR', 'OR'), ('LPAREN', '('), ('TERM', 'c'), ('RPAREN', ')'))
+    # Only space-delimited words become operators
+    assert lv.parse_filter_expression('AND(x)') == (
+        ('TERM', 'AND'), ('AND', 'AND'), ('LPAREN', '('), ('TERM', 'x'), ('RPAREN', ')'))
+    assert lv.parse_filter_expression('x "unterminated (phrase') == (
+        ('TERM', 'x'), ('AND', 'AND'), ('TERM', 'unterminated (phrase'))
+
+
+class _RecordingPad:
+    def __init__(self):
+        self.rows = []
+
+    def chgat(self, row, col, length, attr):
+        self.rows.append(row)
+
+
+def test_highlight_visible_matches_paints_each_block_once(monkeypatch):
+    monkeypatch.setattr(lv.curses, "color_pair", lambda n: n)
+    line_positions = list(range(1000))
+    matches = [(i, 0, 1) for i in range(1000)]
+    pad, painted = _RecordingPad(), set()
+    lv.highlight_visible_matches(pad, line_positions, False, 80, matches, 0, painted, 10, 30)
+    assert pad.rows == list(range(lv.HIGHLIGHT_CHUNK_ROWS))
+    lv.highlight_visible_matches(pad, line_positions, False, 80, matches, 0, painted, 40, 60)
+    assert len(pad.rows) == lv.HIGHLIGHT_CHUNK_ROWS
+
+
+class _RecordingScreen:
+    def __init__(self, h, w):
+        self.size = (h, w)
+        self.calls = []
+
+    def getmaxyx(self):
+        return self.size
+
+    def addstr(self, y, x, text, attr):
+        self.calls.append((y, x, text))
+
+
+def test_paint_prompt_row_fills_row_up_to_case_indicator(monkeypatch):
+    monkeypatch.setattr(lv.curses, "color_pair", lambda n: n)
+    screen = _RecordingScreen(24, 40)
+    case_text = lv.SEARCH_CASE_TEXT[False]
+    assert lv.paint_prompt_row(screen, 24, 40, lv.SEARCH_PROMPT, "err", case_text) == len(lv.SEARCH_PROMPT) + 3
+    assert "".join(text for _, _, text in screen.calls) == (lv.SEARCH_PROMPT + "err").ljust(40 - len(case_text) - 1) + case_text
+    assert {y for y, _, _ in screen.calls} == {23}
+
+
+def test_paint_log_header_centers_text_on_blank_row(monkeypatch):
+    monkeypatch.setattr(lv.curses, "color_pair", lambda n: n)
+    screen = _RecordingScreen(24, 20)
+    lv.paint_log_header(screen, 20, " Logs: x ")
+    assert screen.calls == [(0, 0, " " * 20), (0, 5, " Logs: x ")]
+
+
+def test_filter_refinement_only_rescans_previous_matches(monkeypatch):
+    compiled = lv.get_compiled_filter
+    assert lv.filter_refines(compiled("inf -warn"), compiled("in"))
+    assert lv.filter_refines(compiled("in +re -wa"), compiled("in -warn"))
+    assert not lv.filter_refines(compiled("info"), compiled("info -warn"))
+    assert not lv.filter_refines(compiled("info OR error"), compiled("info"))
+
+    cache = {}
+    assert lv.filter_logs(LOGS, "in", filter_cache=cache)[1].tolist() == [0, 3]
+    scanned = []
+    original = lv.evaluate_filter_batch
+    monkeypatch.setattr(lv, "evaluate_filter_batch",
+                        lambda tokens, haystacks, joined=None: scanned.append(len(haystacks)) or original(tokens, haystacks, joined))
+    filtered, line_map = lv.filter_logs(LOGS, "info +re", filter_cache=cache)
+    assert line_map.tolist() == [3] and filtered == [LOGS[3]]
+    assert scanned == [2]
+
+
+def test_swap_log_pad_restores_spare_until_logs_change(monkeypatch):
+    builds = []
+    def fake_rebuild(logs, width, height, wrap, reuse=None, known_max_len=None):
+        builds.append((wrap, reuse, known_max_len))
+        return {'wrap': wrap, 'lines': list(logs), 'max_line_length': known_max_len}
+    monkeypatch.setattr(lv, "rebuild_log_pad", fake_rebuild)
+    logs = list(LOGS)
+    unwrapped = {'wrap': False, 'lines': list(logs), 'max_line_length': 32}
+    wrapped, spare = lv.swap_log_pad(logs, 80, 24, True, unwrapped, None)
+    # The lines on screen are the same, so their longest length is passed on
+    assert builds == [(True, None, 32)]
+    # Toggling back restores the set-aside pad without drawing anything
+    shown, spare = lv.swap_log_pad(logs, 80, 24, False, wrapped, spare)
+    assert shown is unwrapped and len(builds) == 1
+    # Once the logs grew the spare is redrawn in place and measured again
+    logs.append("new line")
+    shown, spare = lv.swap_log_pad(logs, 80, 24, True, shown, spare)
+    assert builds[-1] == (True, wrapped, None)
+
+
+class _GridPad:
+    def __init__(self, rows, cols):
+        self.size = (rows, cols)
+        self.rows = {}
+        self.writes = []
+        self.cursor = 0
+
+    def getmaxyx(self):
+        return self.size
+
+    def resize(self, rows, cols):
+        if rows > lv.MAX_PAD_ROWS:
+            raise lv.curses.error("curses function returned NULL")
+        self.size = (rows, cols)
+
+    def erase(self):
+        self.rows = {}
+
+    def move(self, y, x):
+        self.cursor = y
+
+    def clrtoeol(self):
+        self.rows.pop(self.cursor, None)
+
+    def clrtobot(self):
+        self.rows = {y: row for y, row in self.rows.items() if y < self.cursor}
+
+    def addstr(self, y, x, text):
+        self.writes.append(y)
+        for offset, row in enumerate(text.split("\n")):
+            self.rows[y + offset] = row
+
+
+def _pad_info_on_grid(logs, width, wrap):
+    rows = lv.estimate_pad_rows(array.array('i', map(len, logs)), width, wrap) + 100
+    pad = _GridPad(lv.pad_capacity_for(rows), max(width - 2, 10) if wrap else max(width - 2, 10, max(map(len, logs)) + 10))
+    reuse = {'pad': pad, 'capacity': pad.size[0], 'layout': None}
+    return lv.rebuild_log_pad(logs, width, 24, wrap, reuse)
+
+
+def test_rebuild_log_pad_redraws_only_changed_rows():
+    logs = [f"line {i}" for i in range(10)]
+    pad_info = _pad_info_on_grid(logs, 40, False)
+    pad = pad_info['pad']
+    pad.writes.clear()
+    changed = logs[:3] + ["normalized 3"] + logs[4:]
+    pad_info = lv.rebuild_log_pad(changed, 40, 24, False, pad_info)
+    assert pad.writes == [3]
+    assert [pad.rows[i] for i in range(10)] == changed
+    # Wrapped layouts keep the unchanged prefix and redraw from the first change
+    logs = [f"line {i} " + "x" * 40 for i in range(10)]
+    pad_info = _pad_info_on_grid(logs, 40, True)
+    pad = pad_info['pad']
+    pad.writes.clear()
+    changed = logs[:8] + ["short"]
+    pad_info = lv.rebuild_log_pad(changed, 40, 24, True, pad_info)
+    assert pad.writes == [16]
+    assert pad_info['actual_lines'] == 17 and pad_info['line_positions'].tolist() == list(range(0, 18, 2)[:8]) + [16]
+    assert 17 not in pad.rows
+    # Highlighted pads are always redrawn in full
+    pad_info['highlighted'] = True
+    pad.writes.clear()
+    lv.rebuild_log_pad(changed, 40, 24, True, pad_info)
+    assert pad.writes == [0]
+
+
+def _new_grid_pad(rows, cols):
+    # ncurses returns NULL for pads of 32768 rows or more
+    if rows > lv.MAX_PAD_ROWS:
+        raise lv.curses.error("curses function returned NULL")
+    return _GridPad(rows, cols)
+
+
+def test_rebuild_log_pad_stays_within_ncurses_pad_limit(monkeypatch):
+    monkeypatch.setattr(lv.curses, "newpad", _new_grid_pad)
+    for count in (17000, 25000, 40000):
+        pad_info = lv.rebuild_log_pad([f"line {i}" for i in range(count)], 80, 24, False)
+        assert pad_info['capacity'] <= lv.MAX_PAD_ROWS
+        assert pad_info['actual_lines'] == min(count, lv.MAX_PAD_ROWS)
+    # Appending stops growing the pad at the ceiling instead of failing
+    pad_info = lv.rebuild_log_pad([f"line {i}" for i in range(17000)], 80, 24, False)
+    lv.append_to_pad(pad_info, [f"more {i}" for i in range(20000)], False, 80)
+    assert pad_info['capacity'] == lv.MAX_PAD_ROWS
+    assert pad_info['actual_lines'] == lv.MAX_PAD_ROWS
+
+
+def test_search_cache_reuses_matches_and_scans_appended_lines():
+    logs = list(LOGS)
+    cache = {}
+    first = lv.search_and_highlight(None, logs, "re", [0, 1, 2, 3, 4], 80, search_cache=cache)
+    assert [m[0] for m in first['matches']] == [3, 3, 4, 4]
+    logs.append("more retries")
+    again = lv.search_and_highlight(None, logs, "re", [0, 1, 2, 3, 4, 5], 80, search_cache=cache)
+    assert again['matches'] is first['matches']
+    assert [m[0] for m in again['matches']] == [3, 3, 4, 4, 5, 5]
+    assert cache[id(logs)]['scanned_upto'] == len(logs)
+    # Another pattern starts a fresh match list
+    assert lv.search_and_highlight(None, logs, "disk", list(range(6)), 80, search_cache=cache)['matches'] == [(2, 6, 4)]
+    # Each list keeps its own matches, so switching back to one does not search it again
+    subset = [logs[2], logs[4]]
+    assert lv.search_and_highlight(None, subset, "disk", [0, 1], 80, search_cache=cache)['matches'] == [(0, 6, 4)]
+    cached = cache[id(logs)]['matches']
+    assert lv.search_and_highlight(None, logs, "disk", list(range(6)), 80, search_cache=cache)['matches'] is cached
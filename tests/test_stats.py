@@ -0,0 +1,97 @@
+"""Tests for the async stats collector's sample bookkeeping and stream tasks."""
+import asyncio
+import threading
+import types
+
+from dtop.core import stats
+
+
+def _collector():
+    tui = types.SimpleNamespace(stats_lock=threading.Lock(), stats_cache={})
+    return stats.AsyncStatsCollector(tui)
+
+
+def _sample(read=0, write=0, rx=0, tx=0):
+    return {
+        "blkio_stats": {"io_service_bytes_recursive": [
+            {"op": "Read", "value": read},
+            {"op": "Write", "value": write},
+        ]},
+        "networks": {"eth0": {"rx_bytes": rx, "tx_bytes": tx}},
+        "memory_stats": {"usage": 50, "limit": 200},
+    }
+
+
+def test_record_stats_computes_rates_between_samples():
+    collector = _collector()
+    collector.record_stats("c1", _sample(read=1000, write=0, rx=500, tx=100), 10.0)
+    first = collector.tui.stats_cache["c1"]
+    assert first["block_read_rate"] == 0.0
+    assert first["mem"] == 25.0
+
+    collector.record_stats("c1", _sample(read=3000, write=400, rx=1500, tx=100), 12.0)
+    second = collector.tui.stats_cache["c1"]
+    assert second["block_read_rate"] == 1000.0
+    assert second["block_write_rate"] == 200.0
+    assert second["net_in_rate"] == 500.0
+    assert second["net_out_rate"] == 0.0
+    assert second["block_read"] == 3000
+    assert second["time"] == 12.0
+
+
+def test_record_stats_keeps_rates_for_close_samples_and_skips_counter_resets():
+    collector = _collector()
+    collector.record_stats("c1", _sample(rx=0), 0.0)
+    collector.record_stats("c1", _sample(rx=2000), 1.0)
+    assert collector.tui.stats_cache["c1"]["net_in_rate"] == 2000.0
+
+    # Samples closer than half a second carry the previous rate forward
+    collector.record_stats("c1", _sample(rx=2100), 1.2)
+    assert collector.tui.stats_cache["c1"]["net_in_rate"] == 2000.0
+
+    # A counter that went backwards (container restart) reads as zero
+    collector.record_stats("c1", _sample(rx=10), 3.0)
+    assert collector.tui.stats_cache["c1"]["net_in_rate"] == 0.0
+
+
+def test_collect_all_stats_reconciles_stream_tasks(monkeypatch):
+    collector = _collector()
+    collector.session = types.SimpleNamespace(closed=False)
+    started = []
+
+    async def fake_stream(container_id):
+        started.append(container_id)
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(collector, "stream_container_stats", fake_stream)
+
+    def running(*ids):
+        return [types.SimpleNamespace(id=cid, status="running") for cid in ids]
+
+    async def scenario():
+        await collector.collect_all_stats(running("a", "b"))
+        await asyncio.sleep(0)
+        assert set(collector.stream_tasks) == {"a", "b"}
+        task_a = collector.stream_tasks["a"]
+        task_b = collector.stream_tasks["b"]
+
+        # "a" went away and "c" appeared; "b" keeps its existing stream
+        await collector.collect_all_stats(running("b", "c") + [types.SimpleNamespace(id="d", status="exited")])
+        await asyncio.sleep(0)
+        assert set(collector.stream_tasks) == {"b", "c"}
+        assert collector.stream_tasks["b"] is task_b
+        assert task_a.cancelled()
+
+        # A stream that ended on its own is restarted on the next pass
+        task_b.cancel()
+        await asyncio.sleep(0)
+        await collector.collect_all_stats(running("b", "c"))
+        await asyncio.sleep(0)
+        assert collector.stream_tasks["b"] is not task_b
+
+        collector.session = None
+        await collector.__aexit__(None, None, None)
+        assert collector.stream_tasks == {}
+
+    asyncio.run(scenario())
+    assert sorted(started) == ["a", "b", "b", "c"]
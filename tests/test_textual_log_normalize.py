@@ -22,6 +22,15 @@ def test_split_docker_log_timestamp_strips_z_space_without_truncating_message():
     assert msg.startswith("{")
 
 
+def test_evaluate_filter_matches_terms_case_insensitively():
+    screen = types.SimpleNamespace(case_sensitive=False)
+    tokens = tlv.LogViewScreen.parse_filter_expression(screen, "ERROR -Disk")
+    assert tlv.LogViewScreen.evaluate_filter(screen, tokens, "error: network down")
+    assert not tlv.LogViewScreen.evaluate_filter(screen, tokens, "Error: disk full")
+    screen.case_sensitive = True
+    assert not tlv.LogViewScreen.evaluate_filter(screen, tokens, "error: network down")
+
+
 def _fake_screen_for_worker():
     applied: list = []
 
@@ -134,3 +143,27 @@ def test_process_and_display_logs_schedules_exclusive_worker():
     assert calls[0].get("group") == "log_normalize"
     assert calls[0].get("thread") is False
     assert calls[0].get("exit_on_error") is False
+
+
+def test_handle_logs_loaded_appends_past_cap_until_trim_slack_is_used():
+    calls: list = []
+    screen = types.SimpleNamespace(
+        max_lines=10,
+        raw_logs=[f"l{i}" for i in range(10)],
+        raw_logs_with_timestamps=[f"ts l{i}" for i in range(10)],
+        _last_raw_len=10,
+        normalize_enabled=False,
+        is_following=False,
+        _can_incremental_append=lambda: True,
+        _append_new_log_lines=lambda start: calls.append(("append", start)),
+        update_stats=lambda: None,
+        process_and_display_logs=lambda: calls.append(("full",)),
+    )
+
+    tlv.LogViewScreen.handle_logs_loaded(screen, (["l9", "l10"], ["ts l9", "ts l10"]))
+    assert calls == [("append", 10)]
+    assert len(screen.raw_logs) == 11
+
+    tlv.LogViewScreen.handle_logs_loaded(screen, (["l10", "l11"], ["ts l10", "ts l11"]))
+    assert calls[-1] == ("full",)
+    assert screen.raw_logs == [f"l{i}" for i in range(2, 12)]